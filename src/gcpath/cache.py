@@ -4,8 +4,12 @@ Cache management for gcpath.
 This module handles reading from and writing to the cache file.
 """
 
+import functools
 import json
 import logging
+import os
+import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 CACHE_DIR = Path.home() / ".gcpath"
 CACHE_FILE = CACHE_DIR / "cache.json"
-CACHE_VERSION = 1
+CACHE_VERSION = 2
 DEFAULT_CACHE_TTL_HOURS = 72
 
 
@@ -37,30 +41,38 @@ class CacheInfo:
     project_count: int
 
 
+def _projects_to_columns(projects: List[Project]) -> Dict[str, List[Any]]:
+    """Serializes projects as parallel per-field lists."""
+    return {
+        "names": [p.name for p in projects],
+        "project_ids": [p.project_id for p in projects],
+        "display_names": [p.display_name for p in projects],
+        "parents": [p.parent for p in projects],
+        "folder_names": [p.folder.name if p.folder else None for p in projects],
+    }
+
+
 def _hierarchy_to_dict(hierarchy: Hierarchy) -> Dict[str, Any]:
-    """Serializes the Hierarchy object to a dictionary."""
+    """Serializes the Hierarchy object to a dictionary.
+
+    Folders and projects are stored column-wise (one list per field) rather
+    than as one dict per resource, so field names are not repeated for every
+    entry in the file.
+    """
     organizations_data = []
 
     # Map projects to their organizations for nested storage
-    org_projects: Dict[str, List[Dict[str, Any]]] = {}
-    orgless_projects_data: List[Dict[str, Any]] = []
+    org_projects: Dict[str, List[Project]] = {}
+    orgless_projects: List[Project] = []
 
     for project in hierarchy.projects:
-        project_data = {
-            "name": project.name,
-            "project_id": project.project_id,
-            "display_name": project.display_name,
-            "parent": project.parent,
-            "folder_name": project.folder.name if project.folder else None,
-        }
-
         if project.organization:
             org_name = project.organization.organization.name
             if org_name not in org_projects:
                 org_projects[org_name] = []
-            org_projects[org_name].append(project_data)
+            org_projects[org_name].append(project)
         else:
-            orgless_projects_data.append(project_data)
+            orgless_projects.append(project)
 
     for org_node in hierarchy.organizations:
         org_name = org_node.organization.name
@@ -69,32 +81,61 @@ def _hierarchy_to_dict(hierarchy: Hierarchy) -> Dict[str, Any]:
             "display_name": org_node.organization.display_name,
         }
 
+        folders = list(org_node.folders.values())
         folders_data = {
-            name: {
-                "name": folder.name,
-                "display_name": folder.display_name,
-                "ancestors": folder.ancestors,
-                "parent": folder.parent,
-            }
-            for name, folder in org_node.folders.items()
+            "names": [f.name for f in folders],
+            "display_names": [f.display_name for f in folders],
+            "ancestors": [f.ancestors for f in folders],
+            "parents": [f.parent for f in folders],
         }
 
         organizations_data.append(
             {
                 "organization": org_proto_data,
                 "folders": folders_data,
-                "projects": org_projects.get(org_name, []),
+                "projects": _projects_to_columns(org_projects.get(org_name, [])),
             }
         )
 
+    now = time.time()
     return {
         "version": CACHE_VERSION,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        # ISO form for people reading the file, epoch form for freshness checks
+        "timestamp": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+        "timestamp_epoch": now,
         "organizations": organizations_data,
-        "organizationless_projects": orgless_projects_data,
+        "organizationless_projects": _projects_to_columns(orgless_projects),
     }
 
 
+def _projects_from_columns(
+    columns: Dict[str, List[Any]], node: Optional[OrganizationNode]
+) -> List[Project]:
+    """Deserializes column-wise project data, linking folders from node.
+
+    Project parents repeat across many projects, so they are interned to share
+    one string object per distinct parent.
+    """
+    folders = node.folders if node else {}
+    return [
+        Project(
+            name=name,
+            project_id=project_id,
+            display_name=display_name,
+            parent=sys.intern(parent),
+            organization=node,
+            folder=folders.get(folder_name) if folder_name else None,
+        )
+        for name, project_id, display_name, parent, folder_name in zip(
+            columns.get("names", []),
+            columns.get("project_ids", []),
+            columns.get("display_names", []),
+            columns.get("parents", []),
+            columns.get("folder_names", []),
+        )
+    ]
+
+
 def _dict_to_hierarchy(data: Dict[str, Any]) -> Optional[Hierarchy]:
     """Deserializes a dictionary to a Hierarchy object."""
     if data.get("version") != CACHE_VERSION:
@@ -120,55 +161,61 @@ def _dict_to_hierarchy(data: Dict[str, Any]) -> Optional[Hierarchy]:
         node = OrganizationNode(organization=org_proto)
         org_nodes.append(node)
 
-        # Reconstruct Folders
-        for folder_name, folder_data in org_data.get("folders", {}).items():
-            folder = Folder(
-                name=folder_data["name"],
-                display_name=folder_data["display_name"],
-                ancestors=folder_data["ancestors"],
-                parent=folder_data["parent"],
+        # Reconstruct Folders. Folder and org names recur in every descendant's
+        # ancestors and parent, so they are interned to share one string each.
+        folders_data = org_data.get("folders", {})
+        for name, display_name, ancestors, parent in zip(
+            folders_data.get("names", []),
+            folders_data.get("display_names", []),
+            folders_data.get("ancestors", []),
+            folders_data.get("parents", []),
+        ):
+            name = sys.intern(name)
+            node.folders[name] = Folder(
+                name=name,
+                display_name=display_name,
+                ancestors=[sys.intern(a) for a in ancestors],
+                parent=sys.intern(parent),
                 organization=node,
             )
-            node.folders[folder_name] = folder
 
         # Reconstruct Projects for this Org
-        for p_data in org_data.get("projects", []):
-            folder_name = p_data.get("folder_name")
-            parent_folder = node.folders.get(folder_name) if folder_name else None
-
-            project = Project(
-                name=p_data["name"],
-                project_id=p_data["project_id"],
-                display_name=p_data["display_name"],
-                parent=p_data["parent"],
-                organization=node,
-                folder=parent_folder,
-            )
-            projects.append(project)
+        projects.extend(_projects_from_columns(org_data.get("projects", {}), node))
 
     # Reconstruct Organizationless Projects
-    for p_data in data.get("organizationless_projects", []):
-        project = Project(
-            name=p_data["name"],
-            project_id=p_data["project_id"],
-            display_name=p_data["display_name"],
-            parent=p_data["parent"],
-            organization=None,
-            folder=None,
-        )
-        projects.append(project)
+    projects.extend(
+        _projects_from_columns(data.get("organizationless_projects", {}), None)
+    )
 
     return Hierarchy(organizations=org_nodes, projects=projects)
 
 
 def read_cache_raw() -> Optional[Dict[str, Any]]:
-    """Reads the raw JSON data from the cache file without deserializing to Hierarchy."""
+    """Reads the raw JSON data from the cache file without deserializing to Hierarchy.
+
+    The parsed data is reused while the file's mtime and size are unchanged,
+    so a command that checks the cache status after reading it parses once.
+    """
     if not CACHE_FILE.exists():
         logger.debug("Cache file not found.")
         return None
 
     try:
-        with open(CACHE_FILE, "r") as f:
+        st = CACHE_FILE.stat()
+        return _read_cache_file(CACHE_FILE, st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        logger.error(f"An unexpected error occurred while reading cache: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _read_cache_file(path: Path, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Parses the cache file; memoized on its (path, mtime, size) identity.
+
+    Callers must treat the returned data as read-only.
+    """
+    try:
+        with open(path, "r") as f:
             data = json.load(f)
         logger.debug("Successfully loaded raw data from cache file.")
         return data
@@ -180,24 +227,45 @@ def read_cache_raw() -> Optional[Dict[str, Any]]:
         return None
 
 
-def is_cache_fresh(
-    data: Dict[str, Any], ttl_hours: float = DEFAULT_CACHE_TTL_HOURS
-) -> bool:
-    """Checks if the cache data is within the TTL."""
+def _cache_age_seconds(data: Dict[str, Any]) -> Optional[float]:
+    """Returns the age of the cache data in seconds, or None if unknown."""
+    timestamp_epoch = data.get("timestamp_epoch")
+    if isinstance(timestamp_epoch, (int, float)):
+        return time.time() - timestamp_epoch
+
+    # Caches written before timestamp_epoch only carry the ISO timestamp
     timestamp_str = data.get("timestamp")
     if not timestamp_str:
-        return False
+        return None
 
     try:
         cached_time = datetime.fromisoformat(timestamp_str)
-        age_seconds = (datetime.now(timezone.utc) - cached_time).total_seconds()
-        return age_seconds < ttl_hours * 3600
+        return (datetime.now(timezone.utc) - cached_time).total_seconds()
     except (ValueError, TypeError):
-        return False
+        return None
+
+
+def is_cache_fresh(
+    data: Dict[str, Any], ttl_hours: float = DEFAULT_CACHE_TTL_HOURS
+) -> bool:
+    """Checks if the cache data is within the TTL."""
+    age_seconds = _cache_age_seconds(data)
+    return age_seconds is not None and age_seconds < ttl_hours * 3600
 
 
 def read_cache(ttl_hours: float = DEFAULT_CACHE_TTL_HOURS) -> Optional[Hierarchy]:
     """Reads the hierarchy from the cache file. Returns None if stale or missing."""
+    # The file is written after its timestamp is taken, so a file whose mtime
+    # is already past the TTL cannot hold fresh data; skip parsing it
+    try:
+        if CACHE_FILE.exists() and (
+            time.time() - CACHE_FILE.stat().st_mtime >= ttl_hours * 3600
+        ):
+            logger.debug("Cache file is older than the TTL, ignoring.")
+            return None
+    except OSError:
+        pass
+
     data = read_cache_raw()
     if data is None:
         return None
@@ -240,25 +308,24 @@ def get_cache_info(
                 project_count=0,
             )
 
-        fresh = is_cache_fresh(data, ttl_hours)
+        age_seconds = _cache_age_seconds(data)
+        fresh = age_seconds is not None and age_seconds < ttl_hours * 3600
 
-        age_seconds: Optional[float] = None
-        timestamp_str = data.get("timestamp")
-        if timestamp_str:
-            try:
-                cached_time = datetime.fromisoformat(timestamp_str)
-                age_seconds = (
-                    datetime.now(timezone.utc) - cached_time
-                ).total_seconds()
-            except (ValueError, TypeError):
-                pass
+        version = data.get("version")
+
+        def count(resources: Any) -> int:
+            # Older cache versions store one entry per resource rather than
+            # per-field columns
+            if version == CACHE_VERSION:
+                return len(resources.get("names", []))
+            return len(resources)
 
         # Count resources without full deserialization
         orgs = data.get("organizations", [])
         org_count = len(orgs)
-        folder_count = sum(len(org.get("folders", {})) for org in orgs)
-        project_count = sum(len(org.get("projects", [])) for org in orgs) + len(
-            data.get("organizationless_projects", [])
+        folder_count = sum(count(org.get("folders", {})) for org in orgs)
+        project_count = sum(count(org.get("projects", {})) for org in orgs) + count(
+            data.get("organizationless_projects", {})
         )
 
         return CacheInfo(
@@ -266,7 +333,7 @@ def get_cache_info(
             fresh=fresh,
             age_seconds=age_seconds,
             size_bytes=size_bytes,
-            version=data.get("version"),
+            version=version,
             org_count=org_count,
             folder_count=folder_count,
             project_count=project_count,
@@ -285,15 +352,27 @@ def get_cache_info(
 
 
 def write_cache(hierarchy: Hierarchy) -> None:
-    """Writes the hierarchy to the cache file."""
+    """Writes the hierarchy to the cache file.
+
+    The payload is written to a temporary file next to the cache and moved into
+    place with os.replace, so readers never see a partially written cache.
+    """
+    tmp_file = CACHE_FILE.with_suffix(".tmp")
     try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if not CACHE_DIR.is_dir():
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
         data = _hierarchy_to_dict(hierarchy)
-        with open(CACHE_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        # json.dumps without indent runs on the C encoder, while json.dump
+        # always streams through the pure-Python one
+        payload = json.dumps(data, separators=(",", ":"))
+        with open(tmp_file, "w") as f:
+            f.write(payload)
+        os.replace(tmp_file, CACHE_FILE)
+        _read_cache_file.cache_clear()
         logger.debug(f"Successfully wrote hierarchy to cache file: {CACHE_FILE}")
     except Exception as e:
         logger.error(f"Failed to write to cache file: {e}")
+        tmp_file.unlink(missing_ok=True)
 
 
 def clear_cache() -> bool:
@@ -301,6 +380,7 @@ def clear_cache() -> bool:
     try:
         if CACHE_FILE.exists():
             CACHE_FILE.unlink()
+            _read_cache_file.cache_clear()
             logger.debug(f"Successfully deleted cache file: {CACHE_FILE}")
             return True
     except Exception as e:
@@ -1,6 +1,6 @@
 import typer
 import logging
-from typing import Optional, List, Dict, Union
+from typing import Optional, List, Union
 from typing_extensions import Annotated
 from rich.console import Console
 from rich import print as rprint
@@ -9,18 +9,19 @@ from google.api_core import exceptions as gcp_exceptions
 
 from gcpath.core import (
     Hierarchy,
-    path_escape,
-    Project,
     GCPathError,
     OrganizationNode,
     Folder,
 )
 from gcpath.formatters import (
     filter_direct_children,
-    build_items_list,
+    build_items_direct,
+    build_items_recursive,
     sort_resources,
     format_tree_label,
     build_tree_view,
+    build_folders_by_parent,
+    build_projects_by_parent,
 )
 from gcpath.cache import (
     read_cache,
@@ -306,20 +307,21 @@ def ls(
             except Exception as e:
                 logger.warning(f"Could not resolve target path: {e}")
 
-        # Filter to get direct children
-        current_folders, current_projects = filter_direct_children(
-            hierarchy, target_resource_name
-        )
-
-        # Build items list for display
-        items = build_items_list(
-            hierarchy,
-            current_folders,
-            current_projects,
-            target_path_prefix,
-            target_resource_name,
-            recursive,
-        )
+        # Build items list for display. A recursive listing walks the whole
+        # hierarchy, so only the direct listing needs the children filter.
+        if recursive:
+            items = build_items_recursive(hierarchy, target_resource_name)
+        else:
+            current_folders, current_projects = filter_direct_children(
+                hierarchy, target_resource_name
+            )
+            items = build_items_direct(
+                hierarchy,
+                current_folders,
+                current_projects,
+                target_path_prefix,
+                target_resource_name,
+            )
 
         # Sort items by path
         items = sort_resources(items)
@@ -334,21 +336,18 @@ def ls(
             table.add_column("Resource Name", overflow="fold")
 
             for path, obj in items:
-                resource_name = ""
-
-                if isinstance(obj, OrganizationNode):
-                    resource_name = obj.organization.name
-                elif isinstance(obj, Folder):
-                    resource_name = obj.name
-                elif isinstance(obj, Project):
-                    resource_name = obj.name
-
+                # Folders and projects carry their resource name directly
+                resource_name = (
+                    obj.organization.name
+                    if isinstance(obj, OrganizationNode)
+                    else obj.name
+                )
                 table.add_row(path, resource_name)
 
             console.print(table)
-        else:
-            for path, _ in items:
-                print(path)
+        elif items:
+            # One write for the whole listing instead of a print() per line
+            print("\n".join([path for path, _ in items]))
 
     except Exception as e:
         handle_error(e)
@@ -500,6 +499,7 @@ def tree(
                     )
                     # Add to org's folders so build_tree can find children
                     org_node.folders[target_resource_name] = synthetic_folder
+                    org_node.reset_path_index()
                     nodes_to_process = [synthetic_folder]
                     logger.debug(
                         f"tree command: created synthetic folder {synthetic_folder.name}"
@@ -525,20 +525,19 @@ def tree(
             else "[bold cyan]GCP Hierarchy[/bold cyan]"
         )
 
-        # Build projects_by_parent mapping for tree building
-        projects_by_parent: Dict[str, List[Project]] = {}
-        for proj in hierarchy.projects:
-            projects_by_parent.setdefault(proj.parent, []).append(proj)
+        # Build parent -> children mappings once for the whole tree
+        projects_by_parent = build_projects_by_parent(hierarchy)
+        folders_by_parent = build_folders_by_parent(hierarchy)
 
         # Add root nodes to tree
         for node in nodes_to_process:
             if isinstance(node, OrganizationNode):
                 node_id = node.organization.name
                 if target_resource_name:
-                    safe_path = f"//{path_escape(node.organization.display_name)}"
+                    safe_path = node.path
                     label = f"[bold cyan]{safe_path}[/bold cyan]"
                 else:
-                    label = f"[bold magenta]//{path_escape(node.organization.display_name)}[/bold magenta]"
+                    label = f"[bold magenta]{node.path}[/bold magenta]"
             else:
                 node_id = node.name
                 label = f"[bold cyan]{node.path}[/bold cyan]"
@@ -548,20 +547,24 @@ def tree(
 
             node_tree = root_tree.add(label)
             build_tree_view(
-                node_tree, node, hierarchy, projects_by_parent, level, 0, show_ids
+                node_tree,
+                node,
+                hierarchy,
+                projects_by_parent,
+                level,
+                0,
+                show_ids,
+                folders_by_parent,
             )
 
         # Organizationless projects
-        if not target_resource_name and any(
-            not p.organization for p in hierarchy.projects
-        ):
+        if not target_resource_name and hierarchy.organizationless_projects:
             orgless_node = root_tree.add(
                 "[bold yellow](organizationless)[/bold yellow]"
             )
             if level is None or level >= 1:
-                orgless_projs = [p for p in hierarchy.projects if not p.organization]
-                orgless_projs.sort(key=lambda x: x.display_name)
-                for p in orgless_projs:
+                # Already sorted by display name when the hierarchy was built
+                for p in hierarchy.organizationless_projects:
                     label = format_tree_label(p, show_ids)
                     orgless_node.add(label)
 
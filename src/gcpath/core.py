@@ -1,12 +1,20 @@
+import collections
+import functools
 import logging
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar
 
 from google.cloud import resourcemanager_v3  # type: ignore
 from google.api_core import exceptions
 
 from gcpath.loaders import (
+    fetch_project_rows_asset,
+    get_folders_client,
+    get_organizations_client,
+    get_projects_client,
+    is_asset_query_literal,
     load_folders_rm,
     load_folders_asset,
     load_projects_asset,
@@ -18,6 +26,11 @@ from gcpath.loaders import (
 # Configuration should happen at the application entry point.
 logger = logging.getLogger(__name__)
 
+# Upper bound on organizations whose folders/projects are loaded concurrently
+ORG_LOAD_MAX_WORKERS = 8
+
+T = TypeVar("T")
+
 
 class GCPathError(Exception):
     """Base exception for gcpath."""
@@ -37,15 +50,40 @@ class PathParsingError(GCPathError, ValueError):
     pass
 
 
+@functools.lru_cache(maxsize=4096)
 def path_escape(display_name: str) -> str:
     """Escape display names for use in paths."""
     return urllib.parse.quote(display_name, safe="")
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganizationNode:
     organization: resourcemanager_v3.Organization
     folders: Dict[str, "Folder"] = field(default_factory=dict)
+    _escaped_display_name: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _path_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Built on the first path lookup; see reset_path_index()
+    _folders_by_parts: Optional[Dict[Tuple[str, ...], List["Folder"]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def escaped_display_name(self) -> str:
+        """Path-escaped organization display name, computed once."""
+        if self._escaped_display_name is None:
+            self._escaped_display_name = path_escape(self.organization.display_name)
+        return self._escaped_display_name
+
+    @property
+    def path(self) -> str:
+        """Path of the organization itself, e.g. "//example.com"."""
+        if self._path_cache is None:
+            self._path_cache = "//" + self.escaped_display_name
+        return self._path_cache
 
     def paths(self) -> List[str]:
         return [f.path for f in self.folders.values()]
@@ -56,25 +94,39 @@ class OrganizationNode:
         if not clean_path:
             return self.organization.name
 
-        parts = clean_path.split("/")
-        matches = []
-        for folder in self.folders.values():
-            if folder.is_path_match(parts):
-                matches.append(folder)
+        if self._folders_by_parts is None:
+            self._folders_by_parts = self._build_folders_by_parts()
 
-        if len(matches) == 0:
+        matches = self._folders_by_parts.get(tuple(clean_path.split("/")))
+
+        # Common case first: the path names exactly one folder
+        if matches and len(matches) == 1:
+            return matches[0].name
+        if not matches:
             raise ResourceNotFoundError(
                 f"No folder found with path '{path}' in '{self.organization.display_name}'"
             )
-        if len(matches) > 1:
-            raise ResourceNotFoundError(
-                f"Multiple folders found with path '{path}' in '{self.organization.display_name}'"
-            )
+        raise ResourceNotFoundError(
+            f"Multiple folders found with path '{path}' in '{self.organization.display_name}'"
+        )
+
+    def reset_path_index(self) -> None:
+        """Drop the path lookup index after folders were added or changed."""
+        self._folders_by_parts = None
 
-        return matches[0].name
+    def _build_folders_by_parts(self) -> Dict[Tuple[str, ...], List["Folder"]]:
+        """Index folders by their display-name path for O(1) path lookups."""
+        index: Dict[Tuple[str, ...], List["Folder"]] = {}
+        for folder in self.folders.values():
+            parts = folder.parts
+            # Skip folders whose ancestry could not be fully resolved
+            if len(parts) + 1 != len(folder.ancestors):
+                continue
+            index.setdefault(parts, []).append(folder)
+        return index
 
 
-@dataclass
+@dataclass(slots=True)
 class Folder:
     name: str
     display_name: str
@@ -83,42 +135,81 @@ class Folder:
     parent: str = (
         ""  # Parent resource name (e.g., 'organizations/123' or 'folders/456')
     )
+    # Parts and path are built lazily on first access and reused afterwards,
+    # but only once every ancestor is loaded; see reset_path()
+    _parts_cache: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _path_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Set once the incomplete path of this folder has been warned about
+    _warned_incomplete: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
 
     def is_path_match(self, path_parts: List[str]) -> bool:
         # path matching logic
         if len(path_parts) + 1 != len(self.ancestors):
             return False
 
-        # Determine ancestors to check against path.
-        for i, part in enumerate(path_parts):
-            ancestor_resource_name = self.ancestors[len(path_parts) - i - 1]
-            folder = self.organization.folders.get(ancestor_resource_name)
-            if not folder:
-                return False
+        # A missing ancestor leaves parts shorter than the path, so no match
+        return self.parts == tuple(path_parts)
 
-            if folder.display_name != part:
-                return False
-
-        return True
+    @property
+    def parts(self) -> Tuple[str, ...]:
+        """Display names from the top-level folder down to this folder."""
+        if self._parts_cache is not None:
+            return self._parts_cache
+        parts = self._build_parts()
+        # A missing ancestor leaves parts short; retry until it has been loaded
+        if len(parts) + 1 == len(self.ancestors):
+            self._parts_cache = parts
+        return parts
+
+    def _build_parts(self) -> Tuple[str, ...]:
+        parts = []
+        # We iterate from Top to Bottom: [Leaf, Parent, ..., Org]
+        for res_name in reversed(self.ancestors[:-1]):
+            parent = self.organization.folders.get(res_name)
+            if parent:
+                parts.append(parent.display_name)
+            else:
+                # Path indexes build the parts of every folder, so only path
+                # warns, once, for a folder that is actually shown
+                logger.debug(f"Ancestor {res_name} not found in folders map")
+        return tuple(parts)
 
     @property
     def path(self) -> str:
-        # Reconstruct path
-        path_str = "//" + path_escape(self.organization.organization.display_name)
+        if self._path_cache is not None:
+            return self._path_cache
+        path = self._build_path()
+        # Only a path built from the complete ancestry is kept
+        if self._parts_cache is not None:
+            self._path_cache = path
+        elif not self._warned_incomplete:
+            self._warned_incomplete = True
+            logger.warning(
+                f"Path of {self.name} is incomplete: an ancestor was not loaded"
+            )
+        return path
 
-        # We iterate from Top to Bottom: [Leaf, Parent, ..., Org]
-        if len(self.ancestors) >= 2:
-            for i in range(len(self.ancestors) - 2, -1, -1):
-                res_name = self.ancestors[i]
-                parent = self.organization.folders.get(res_name)
-                if parent:
-                    path_str += "/" + path_escape(parent.display_name)
-                else:
-                    logger.warning(f"Ancestor {res_name} not found in folders map")
+    def reset_path(self) -> None:
+        """Drop the cached parts and path after the ancestors have changed."""
+        self._parts_cache = None
+        self._path_cache = None
+        self._warned_incomplete = False
+
+    def _build_path(self) -> str:
+        # Reconstruct path
+        path_str = "//" + self.organization.escaped_display_name
+        for part in self.parts:
+            path_str += "/" + path_escape(part)
         return path_str
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     name: str
     project_id: str
@@ -126,13 +217,31 @@ class Project:
     parent: str
     organization: Optional["OrganizationNode"]
     folder: Optional[Folder]
+    # Built on first access like Folder.path. Under a folder, the cached path
+    # is only reused while the folder still returns the same cached path, so
+    # a folder whose ancestry is incomplete or reset is picked up again
+    _path_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _folder_path: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def path(self) -> str:
         if self.folder:
-            return f"{self.folder.path}/{path_escape(self.display_name)}"
+            folder_path = self.folder.path
+            if self._path_cache is None or self._folder_path is not folder_path:
+                self._path_cache = f"{folder_path}/{path_escape(self.display_name)}"
+                self._folder_path = folder_path
+            return self._path_cache
+        if self._path_cache is None:
+            self._path_cache = self._build_path()
+        return self._path_cache
+
+    def _build_path(self) -> str:
         if self.organization:
-            return f"//{path_escape(self.organization.organization.display_name)}/{path_escape(self.display_name)}"
+            return f"//{self.organization.escaped_display_name}/{path_escape(self.display_name)}"
         # Organizationless project
         return f"//_/{path_escape(self.display_name)}"
 
@@ -146,15 +255,33 @@ class Hierarchy:
         self._orgs_by_name: Dict[str, OrganizationNode] = {
             o.organization.name: o for o in organizations
         }
-        self._folders_by_name: Dict[str, Folder] = {}
-        for org in organizations:
-            self._folders_by_name.update(org.folders)
+        self._orgs_by_display_name: Dict[str, OrganizationNode] = {
+            o.organization.display_name: o for o in organizations
+        }
+        # A view over each organization's folder dict rather than a merged copy
+        self._folders_by_name: Mapping[str, Folder] = collections.ChainMap(
+            *(o.folders for o in organizations)
+        )
 
         # Public list of all folders for convenience
-        self.folders = list(self._folders_by_name.values())
+        self.folders = [f for o in organizations for f in o.folders.values()]
 
         self._projects_by_name: Dict[str, Project] = {p.name: p for p in projects}
 
+        # Projects outside every loaded organization, listed under "//_",
+        # sorted by display name once for display
+        self.organizationless_projects: List[Project] = sorted(
+            (p for p in projects if not p.organization), key=lambda p: p.display_name
+        )
+
+        # Built on the first path lookup, see _get_project_by_path() and
+        # reset_path_index()
+        self._projects_by_path: Optional[Dict[str, Project]] = None
+
+        # Reverse lookups are pure for a loaded hierarchy, so resolved paths
+        # are memoized per instance, see get_path_by_resource_name()
+        self._paths_by_resource_name: Dict[str, str] = {}
+
     @classmethod
     def load(
         cls,
@@ -173,19 +300,31 @@ class Hierarchy:
                            If None, defaults to loading from organization level.
             recursive: If True, load all descendants. If False, only load direct children.
                       Only applies when via_resource_manager=False (Asset API mode).
+
+        Raises:
+            PathParsingError: If scope_resource cannot be used in an Asset API query.
         """
+        # The scope ends up inside Asset API SQL, and a failure inside the
+        # per-org loads would only be logged, so reject it before loading
+        if (
+            scope_resource
+            and not via_resource_manager
+            and not is_asset_query_literal(scope_resource)
+        ):
+            raise PathParsingError(f"Invalid resource name '{scope_resource}'")
+
         logger.debug("Loading hierarchy from GCP API.")
-        org_client = resourcemanager_v3.OrganizationsClient()
-        project_client = resourcemanager_v3.ProjectsClient()
+        org_client = get_organizations_client()
+        project_client = get_projects_client()
 
-        # Load Organizations
-        org_nodes = cls._load_organizations(
+        # Load Organizations (and, in Asset API mode, their projects)
+        org_nodes, org_projects = cls._load_organizations(
             org_client, display_names, via_resource_manager, scope_resource, recursive
         )
 
         # Load Projects
         all_projects = cls._load_all_projects(
-            project_client, org_nodes, via_resource_manager, scope_resource, recursive
+            project_client, org_nodes, via_resource_manager, org_projects
         )
 
         return cls(organizations=org_nodes, projects=all_projects)
@@ -198,9 +337,15 @@ class Hierarchy:
         via_resource_manager: bool,
         scope_resource: Optional[str],
         recursive: bool,
-    ) -> List[OrganizationNode]:
-        """Load organizations and their folders."""
+    ) -> Tuple[List[OrganizationNode], List[Project]]:
+        """Load organizations and their folders.
+
+        Returns:
+            The organization nodes, and the projects loaded alongside their
+            folders (Asset API mode only; empty for Resource Manager).
+        """
         org_nodes = []
+        org_projects: List[Project] = []
         try:
             logger.debug(
                 f"Calling search_organizations() with display_names filter: {display_names}"
@@ -220,24 +365,76 @@ class Hierarchy:
                 logger.debug(
                     f"Processing organization: {org.display_name} (name: {org.name})"
                 )
-                node = OrganizationNode(organization=org)
-                org_nodes.append(node)
-
-                # Load folders for this organization
-                cls._load_folders_for_org(
-                    node, via_resource_manager, scope_resource, recursive
-                )
+                org_nodes.append(OrganizationNode(organization=org))
 
+            # Organizations are independent, so load their folders concurrently
+            def load_org(node: OrganizationNode) -> List[Project]:
+                if via_resource_manager:
+                    cls._load_folders_for_org(node, True, scope_resource, recursive)
+                    projects: List[Project] = []
+                else:
+                    projects = cls._load_org_asset(node, scope_resource, recursive)
                 logger.debug(
                     f"Loaded {len(node.folders)} folders for org {node.organization.display_name}"
                 )
+                return projects
+
+            loaded = 0
+            try:
+                for projects in cls._map_orgs(load_org, org_nodes):
+                    org_projects.extend(projects)
+                    loaded += 1
+            except Exception:
+                # Like a sequential load, keep the organizations loaded before
+                # the failing one and the failing one itself, but not later ones
+                del org_nodes[loaded + 1 :]
+                raise
 
         except exceptions.PermissionDenied:
             logger.warning("Permission denied searching organizations")
         except Exception as e:
             logger.error(f"Error searching organizations: {e}")
 
-        return org_nodes
+        return org_nodes, org_projects
+
+    @staticmethod
+    def _asset_filters(
+        node: OrganizationNode, scope_resource: Optional[str], recursive: bool
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return the (parent_filter, ancestors_filter) for Asset API queries."""
+        if scope_resource:
+            if recursive:
+                return None, scope_resource
+            return scope_resource, None
+        elif not recursive:
+            return node.organization.name, None
+        return None, None
+
+    @classmethod
+    def _load_org_asset(
+        cls, node: OrganizationNode, scope_resource: Optional[str], recursive: bool
+    ) -> List[Project]:
+        """Load folders and projects for a single organization via Asset API.
+
+        The projects query does not depend on the folders, so it runs while
+        they load; its rows are parsed once node.folders is complete.
+        """
+        parent_filter, ancestors_filter = cls._asset_filters(
+            node, scope_resource, recursive
+        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            project_rows = executor.submit(
+                fetch_project_rows_asset, node, parent_filter, ancestors_filter
+            )
+            cls._load_folders_for_org(node, False, scope_resource, recursive)
+            rows = project_rows.result()
+
+        return load_projects_asset(
+            node,
+            parent_filter=parent_filter,
+            ancestors_filter=ancestors_filter,
+            rows=rows,
+        )
 
     @classmethod
     def _load_folders_for_org(
@@ -252,21 +449,13 @@ class Hierarchy:
             load_folders_rm(node, node.organization.name)
         else:
             # Determine filters for Asset API based on scope_resource and recursive
-            folder_parent_filter = None
-            folder_ancestors_filter = None
-
-            if scope_resource:
-                if recursive:
-                    folder_ancestors_filter = scope_resource
-                else:
-                    folder_parent_filter = scope_resource
-            elif not recursive:
-                folder_parent_filter = node.organization.name
-
+            parent_filter, ancestors_filter = cls._asset_filters(
+                node, scope_resource, recursive
+            )
             load_folders_asset(
                 node,
-                parent_filter=folder_parent_filter,
-                ancestors_filter=folder_ancestors_filter,
+                parent_filter=parent_filter,
+                ancestors_filter=ancestors_filter,
             )
 
             # Load scope folder separately if needed (for recursive scoped loads)
@@ -279,19 +468,20 @@ class Hierarchy:
         project_client,
         org_nodes: List[OrganizationNode],
         via_resource_manager: bool,
-        scope_resource: Optional[str],
-        recursive: bool,
+        org_projects: List[Project],
     ) -> List[Project]:
-        """Load all projects across all organizations."""
+        """Load all projects across all organizations.
+
+        Args:
+            org_projects: Projects already loaded per organization (Asset API mode)
+        """
         all_projects = []
 
         if via_resource_manager:
             all_projects = cls._load_projects_rm(project_client, org_nodes)
         else:
-            # Asset API mode
-            all_projects = cls._load_projects_asset_all_orgs(
-                org_nodes, scope_resource, recursive
-            )
+            # Asset API mode: org projects were loaded alongside the folders
+            all_projects = list(org_projects)
 
             # Load organizationless projects
             existing_project_names = {p.name for p in all_projects}
@@ -312,22 +502,21 @@ class Hierarchy:
             )
             logger.debug("GCP API: search_projects() returned successfully")
 
+            # Build parent lookups once instead of scanning org_nodes per project
+            orgs_by_name = {o.organization.name: o for o in org_nodes}
+            folder_to_org = {fname: o for o in org_nodes for fname in o.folders}
+
             for p_proto in projects_pager:
                 # Find parent organization and folder
                 parent_org = None
                 parent_folder = None
 
                 if p_proto.parent.startswith("organizations/"):
-                    parent_org = next(
-                        (o for o in org_nodes if o.organization.name == p_proto.parent),
-                        None,
-                    )
+                    parent_org = orgs_by_name.get(p_proto.parent)
                 elif p_proto.parent.startswith("folders/"):
-                    for o in org_nodes:
-                        if p_proto.parent in o.folders:
-                            parent_folder = o.folders[p_proto.parent]
-                            parent_org = o
-                            break
+                    parent_org = folder_to_org.get(p_proto.parent)
+                    if parent_org:
+                        parent_folder = parent_org.folders[p_proto.parent]
 
                 proj = Project(
                     name=p_proto.name,
@@ -346,39 +535,33 @@ class Hierarchy:
 
         return all_projects
 
-    @classmethod
-    def _load_projects_asset_all_orgs(
-        cls,
-        org_nodes: List[OrganizationNode],
-        scope_resource: Optional[str],
-        recursive: bool,
-    ) -> List[Project]:
-        """Load projects for all organizations using Asset API."""
-        all_projects = []
-
-        for org_node in org_nodes:
-            # Determine filters for projects
-            project_parent_filter = None
-            project_ancestors_filter = None
-
-            if scope_resource:
-                if recursive:
-                    project_ancestors_filter = scope_resource
-                else:
-                    project_parent_filter = scope_resource
-            elif not recursive:
-                project_parent_filter = org_node.organization.name
-
-            org_projects = load_projects_asset(
-                org_node,
-                parent_filter=project_parent_filter,
-                ancestors_filter=project_ancestors_filter,
-            )
-            all_projects.extend(org_projects)
-
-        return all_projects
+    @staticmethod
+    def _map_orgs(
+        func: Callable[[OrganizationNode], T], org_nodes: List[OrganizationNode]
+    ) -> Iterator[T]:
+        """Apply func to every organization on a thread pool, yielding in order.
+
+        Results are yielded one organization at a time, so a caller keeps the
+        results of the organizations before a failing one; the failure is
+        raised at that organization's position and unstarted loads are
+        cancelled.
+        """
+        if len(org_nodes) <= 1:
+            for node in org_nodes:
+                yield func(node)
+            return
+        max_workers = min(ORG_LOAD_MAX_WORKERS, len(org_nodes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, node) for node in org_nodes]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _parse_path(path: str) -> tuple[str, str]:
         """Parse //org_name/path format without being fragile to urlparse semantics."""
         if not path.startswith("//"):
@@ -401,17 +584,14 @@ class Hierarchy:
         # Reserved for organizationless scope
         if org_name == "_":
             # Search in organizationless projects
-            for proj in self.projects:
-                if not proj.organization and proj.path == path:
-                    return proj.name
+            proj = self._get_project_by_path(path)
+            if proj and not proj.organization:
+                return proj.name
             raise ResourceNotFoundError(
                 f"Project path '{path}' not found in organizationless scope"
             )
 
-        org_node = next(
-            (o for o in self.organizations if o.organization.display_name == org_name),
-            None,
-        )
+        org_node = self._orgs_by_display_name.get(org_name)
         if not org_node:
             raise ResourceNotFoundError(f"Organization '{org_name}' not found")
 
@@ -422,16 +602,50 @@ class Hierarchy:
             return org_node.get_resource_name(resource_path)
         except ResourceNotFoundError:
             # Maybe it's a project at the end of the path?
-            for proj in self.projects:
-                if proj.organization == org_node and proj.path == path:
-                    return proj.name
+            proj = self._get_project_by_path(path)
+            if proj and proj.organization is org_node:
+                return proj.name
             raise
 
+    def _get_project_by_path(self, path: str) -> Optional[Project]:
+        """Look up a project by its full path, indexing all projects on first use."""
+        if self._projects_by_path is not None:
+            return self._projects_by_path.get(path)
+
+        projects_by_path: Dict[str, Project] = {}
+        complete = True
+        for proj in self.projects:
+            # Keep the first project when display names collide
+            projects_by_path.setdefault(proj.path, proj)
+            folder = proj.folder
+            if folder and len(folder.parts) + 1 != len(folder.ancestors):
+                complete = False
+        # A folder with a missing ancestor gives its projects a partial path,
+        # so the index is only kept once every project path is final
+        if complete:
+            self._projects_by_path = projects_by_path
+        return projects_by_path.get(path)
+
+    def reset_path_index(self) -> None:
+        """Drop the path lookups built so far after folders were changed."""
+        for org in self.organizations:
+            org.reset_path_index()
+        self._projects_by_path = None
+        self._paths_by_resource_name.clear()
+
     def get_path_by_resource_name(self, resource_name: str) -> str:
+        path = self._paths_by_resource_name.get(resource_name)
+        if path is None:
+            # Failed lookups raise and are therefore not memoized
+            path = self._lookup_path_by_resource_name(resource_name)
+            self._paths_by_resource_name[resource_name] = path
+        return path
+
+    def _lookup_path_by_resource_name(self, resource_name: str) -> str:
         if resource_name.startswith("organizations/"):
             org = self._orgs_by_name.get(resource_name)
             if org:
-                return "//" + path_escape(org.organization.display_name)
+                return org.path
             raise ResourceNotFoundError(f"Organization '{resource_name}' not found")
 
         if resource_name.startswith("folders/"):
@@ -454,9 +668,9 @@ class Hierarchy:
         Resolves the path for a given resource name by traversing up the hierarchy.
         This avoids loading the entire hierarchy.
         """
-        folders_client = resourcemanager_v3.FoldersClient()
-        projects_client = resourcemanager_v3.ProjectsClient()
-        org_client = resourcemanager_v3.OrganizationsClient()
+        folders_client = get_folders_client()
+        projects_client = get_projects_client()
+        org_client = get_organizations_client()
 
         segments: List[str] = []
         current_resource_name = resource_name
@@ -4,44 +4,98 @@ Display formatting utilities for gcpath CLI.
 This module handles path formatting, resource filtering, and tree visualization.
 """
 
-from typing import List, Dict, Tuple, Union, Optional, Any
+import operator
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple, Union
+
 from gcpath.core import OrganizationNode, Folder, Project, path_escape
 
+_by_display_name = operator.attrgetter("display_name")
+_by_path = operator.itemgetter(0)
+
+
+def build_folders_by_parent(hierarchy) -> Dict[str, List[Folder]]:
+    """Index every loaded folder by its parent resource name.
+
+    Each list is sorted by display name once here, so traversals can iterate
+    it in order; callers must not reorder or extend the lists afterwards.
+
+    Args:
+        hierarchy: The loaded Hierarchy object
+
+    Returns:
+        Dict mapping parent names to folder lists sorted by display name
+    """
+    folders_by_parent: DefaultDict[str, List[Folder]] = defaultdict(list)
+    for org in hierarchy.organizations:
+        for f in org.folders.values():
+            folders_by_parent[f.parent].append(f)
+    for children in folders_by_parent.values():
+        children.sort(key=_by_display_name)
+    # Plain dict, so lookups of childless parents cannot insert empty buckets
+    return dict(folders_by_parent)
+
+
+def build_projects_by_parent(hierarchy) -> Dict[str, List[Project]]:
+    """Index every loaded project by its parent resource name.
+
+    Like build_folders_by_parent(), each list is pre-sorted by display name.
+
+    Args:
+        hierarchy: The loaded Hierarchy object
+
+    Returns:
+        Dict mapping parent names to project lists sorted by display name
+    """
+    projects_by_parent: DefaultDict[str, List[Project]] = defaultdict(list)
+    for p in hierarchy.projects:
+        projects_by_parent[p.parent].append(p)
+    for children in projects_by_parent.values():
+        children.sort(key=_by_display_name)
+    return dict(projects_by_parent)
+
 
 def filter_direct_children(
-    hierarchy, target_resource_name: Optional[str] = None
+    hierarchy,
+    target_resource_name: Optional[str] = None,
+    folders_by_parent: Optional[Dict[str, List[Folder]]] = None,
+    projects_by_parent: Optional[Dict[str, List[Project]]] = None,
 ) -> Tuple[List[Folder], List[Project]]:
     """Filter hierarchy to get direct children of a target resource.
 
     Args:
         hierarchy: The loaded Hierarchy object
         target_resource_name: Resource name to get children of (or None for org-level)
+        folders_by_parent: Dict mapping parent names to folder lists; built
+            from the hierarchy when not given
+        projects_by_parent: Dict mapping parent names to project lists; built
+            from the hierarchy when not given
 
     Returns:
         Tuple of (folders, projects) that are direct children
     """
-    current_folders = []
-    current_projects = []
+    if folders_by_parent is None:
+        folders_by_parent = build_folders_by_parent(hierarchy)
+    if projects_by_parent is None:
+        projects_by_parent = build_projects_by_parent(hierarchy)
 
     if target_resource_name:
         # Find direct children of the target resource
-        for f in hierarchy.folders:
-            if f.parent == target_resource_name:
-                current_folders.append(f)
-        for p in hierarchy.projects:
-            if p.parent == target_resource_name:
-                current_projects.append(p)
-    else:
-        # No target: show org-level resources
-        for org in hierarchy.organizations:
-            for f in org.folders.values():
-                if f.parent == org.organization.name:
-                    current_folders.append(f)
-        for p in hierarchy.projects:
-            if p.organization and p.parent == p.organization.organization.name:
-                current_projects.append(p)
-        # Add organizationless projects
-        current_projects.extend([p for p in hierarchy.projects if not p.organization])
+        return (
+            list(folders_by_parent.get(target_resource_name, ())),
+            list(projects_by_parent.get(target_resource_name, ())),
+        )
+
+    # No target: show org-level resources
+    org_root_names = [org.organization.name for org in hierarchy.organizations]
+    current_folders = [
+        f for name in org_root_names for f in folders_by_parent.get(name, ())
+    ]
+    current_projects = [
+        p for name in org_root_names for p in projects_by_parent.get(name, ())
+    ]
+    # Add organizationless projects, partitioned once when the hierarchy was built
+    current_projects.extend(hierarchy.organizationless_projects)
 
     return current_folders, current_projects
 
@@ -65,31 +119,37 @@ def get_display_path(
     Returns:
         Formatted path string for display
     """
-    if isinstance(item, OrganizationNode):
-        return f"//{path_escape(item.organization.display_name)}"
-    elif isinstance(item, Folder):
-        # For non-recursive mode with direct children, use target prefix
-        # For recursive mode, always use the computed path from hierarchy
-        if (
-            target_path_prefix
-            and target_resource_name
-            and is_direct_child
-            and not recursive
-        ):
-            return f"{target_path_prefix}/{path_escape(item.display_name)}"
-        return item.path
-    elif isinstance(item, Project):
-        # For non-recursive mode with direct children, use target prefix
-        # For recursive mode, always use the computed path from hierarchy
-        if (
-            target_path_prefix
-            and target_resource_name
-            and is_direct_child
-            and not recursive
-        ):
-            return f"{target_path_prefix}/{path_escape(item.display_name)}"
-        return item.path
-    return ""
+    handler = _DISPLAY_PATH_HANDLERS.get(type(item))
+    if handler is None:
+        return ""
+    # The target prefix only applies to direct children in non-recursive mode
+    use_prefix = (
+        target_path_prefix
+        and target_resource_name
+        and is_direct_child
+        and not recursive
+    )
+    return handler(item, target_path_prefix if use_prefix else "")
+
+
+def _org_display_path(item: OrganizationNode, prefix: str) -> str:
+    return item.path
+
+
+def _child_display_path(item: Union[Folder, Project], prefix: str) -> str:
+    # Direct children are shown under the target prefix; otherwise use the
+    # computed path from the hierarchy
+    if prefix:
+        return f"{prefix}/{path_escape(item.display_name)}"
+    return item.path
+
+
+# Exact-type dispatch for get_display_path(); folders and projects share a handler
+_DISPLAY_PATH_HANDLERS: Dict[type, Callable[[Any, str], str]] = {
+    OrganizationNode: _org_display_path,
+    Folder: _child_display_path,
+    Project: _child_display_path,
+}
 
 
 def build_items_list(
@@ -113,136 +173,91 @@ def build_items_list(
     Returns:
         List of (path, resource) tuples
     """
-    items: List[Tuple[str, Union[OrganizationNode, Folder, Project]]] = []
-
     if recursive:
-        # Recursive listing - list everything under the target
-        if target_resource_name:
-            # All loaded folders and projects are descendants
-            for f in hierarchy.folders:
-                items.append(
-                    (
-                        get_display_path(
-                            f,
-                            target_path_prefix,
-                            target_resource_name,
-                            is_direct_child=False,
-                            recursive=True,
-                        ),
-                        f,
-                    )
-                )
-            for p in hierarchy.projects:
-                items.append(
-                    (
-                        get_display_path(
-                            p,
-                            target_path_prefix,
-                            target_resource_name,
-                            is_direct_child=False,
-                            recursive=True,
-                        ),
-                        p,
-                    )
-                )
-        else:
-            # Full recursive list
-            for org in hierarchy.organizations:
-                items.append(
-                    (
-                        get_display_path(
-                            org,
-                            target_path_prefix,
-                            target_resource_name,
-                            is_direct_child=False,
-                            recursive=True,
-                        ),
-                        org,
-                    )
-                )
-                for f in org.folders.values():
-                    items.append(
-                        (
-                            get_display_path(
-                                f,
-                                target_path_prefix,
-                                target_resource_name,
-                                is_direct_child=False,
-                                recursive=True,
-                            ),
-                            f,
-                        )
-                    )
-            for p in hierarchy.projects:
-                items.append(
-                    (
-                        get_display_path(
-                            p,
-                            target_path_prefix,
-                            target_resource_name,
-                            is_direct_child=False,
-                            recursive=True,
-                        ),
-                        p,
-                    )
-                )
+        return build_items_recursive(hierarchy, target_resource_name)
+    return build_items_direct(
+        hierarchy,
+        current_folders,
+        current_projects,
+        target_path_prefix,
+        target_resource_name,
+    )
+
+
+def build_items_recursive(
+    hierarchy, target_resource_name: Optional[str] = None
+) -> List[Tuple[str, Union[OrganizationNode, Folder, Project]]]:
+    """Build the recursive listing: every loaded resource with its full path.
+
+    Args:
+        hierarchy: The loaded Hierarchy object
+        target_resource_name: Resource name being targeted (or None for all orgs)
+
+    Returns:
+        List of (path, resource) tuples
+    """
+    items: List[Tuple[str, Union[OrganizationNode, Folder, Project]]] = []
+    if target_resource_name:
+        # All loaded folders and projects are descendants
+        items.extend([(f.path, f) for f in hierarchy.folders])
     else:
-        # Non-recursive - only direct children
-        if not target_resource_name:
-            for org in hierarchy.organizations:
-                items.append(
-                    (
-                        get_display_path(
-                            org,
-                            target_path_prefix,
-                            target_resource_name,
-                            is_direct_child=False,
-                            recursive=False,
-                        ),
-                        org,
-                    )
-                )
-
-        for f in current_folders:
-            items.append(
-                (
-                    get_display_path(
-                        f,
-                        target_path_prefix,
-                        target_resource_name,
-                        is_direct_child=True,
-                        recursive=False,
-                    ),
-                    f,
-                )
-            )
-        for p in current_projects:
-            items.append(
-                (
-                    get_display_path(
-                        p,
-                        target_path_prefix,
-                        target_resource_name,
-                        is_direct_child=True,
-                        recursive=False,
-                    ),
-                    p,
-                )
-            )
+        # Full recursive list
+        for org in hierarchy.organizations:
+            items.append((org.path, org))
+            items.extend([(f.path, f) for f in org.folders.values()])
+    items.extend([(p.path, p) for p in hierarchy.projects])
+    return items
+
+
+def build_items_direct(
+    hierarchy,
+    current_folders: List[Folder],
+    current_projects: List[Project],
+    target_path_prefix: str = "",
+    target_resource_name: Optional[str] = None,
+) -> List[Tuple[str, Union[OrganizationNode, Folder, Project]]]:
+    """Build the non-recursive listing: organizations or a target's direct children.
 
+    Args:
+        hierarchy: The loaded Hierarchy object
+        current_folders: Folders to display (direct children)
+        current_projects: Projects to display (direct children)
+        target_path_prefix: Path prefix when targeting a specific resource
+        target_resource_name: Resource name being targeted
+
+    Returns:
+        List of (path, resource) tuples
+
+    Note: Paths are assembled inline rather than through get_display_path(),
+          whose per-item type dispatch and argument checks are invariant over
+          the listing.
+    """
+    items: List[Tuple[str, Union[OrganizationNode, Folder, Project]]] = []
+    if not target_resource_name:
+        items.extend([(org.path, org) for org in hierarchy.organizations])
+
+    if target_path_prefix and target_resource_name:
+        prefix = target_path_prefix + "/"
+        esc = path_escape
+        items.extend([(prefix + esc(f.display_name), f) for f in current_folders])
+        items.extend([(prefix + esc(p.display_name), p) for p in current_projects])
+    else:
+        items.extend([(f.path, f) for f in current_folders])
+        items.extend([(p.path, p) for p in current_projects])
     return items
 
 
 def sort_resources(items: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
-    """Sort resources by path.
+    """Sort resources by path, in place.
 
     Args:
-        items: List of (path, resource) tuples
+        items: List of (path, resource) tuples; reordered in place
 
     Returns:
-        Sorted list of (path, resource) tuples
+        The same list, sorted by path
     """
-    return sorted(items, key=lambda x: x[0])
+    items.sort(key=_by_path)
+    return items
 
 
 def format_tree_label(item: Union[Folder, Project], show_ids: bool = False) -> str:
@@ -255,12 +270,12 @@ def format_tree_label(item: Union[Folder, Project], show_ids: bool = False) -> s
     Returns:
         Formatted label string with rich markup
     """
-    if isinstance(item, Folder):
+    if type(item) is Folder:
         label = f"[bold blue]{item.display_name}[/bold blue]"
         if show_ids:
             label += f" [dim]({item.name})[/dim]"
         return label
-    elif isinstance(item, Project):
+    elif type(item) is Project:
         label = f"[green]{item.display_name}[/green]"
         if show_ids:
             label += f" [dim]({item.name})[/dim]"
@@ -276,60 +291,59 @@ def build_tree_view(
     level: Optional[int] = None,
     current_depth: int = 0,
     show_ids: bool = False,
+    folders_by_parent: Optional[Dict[str, List[Folder]]] = None,
 ):
-    """Recursively build tree view of resources.
+    """Build tree view of the resources below current_node.
+
+    The subtree is walked with an explicit stack rather than recursion; each
+    Rich node keeps its children in insertion order (folders, then projects),
+    so the rendered tree does not depend on the walk order.
 
     Args:
         tree_node: Rich Tree node to add children to
         current_node: Current resource node being processed
         hierarchy: The loaded Hierarchy object
-        projects_by_parent: Dict mapping parent names to project lists
+        projects_by_parent: Dict mapping parent names to project lists,
+            pre-sorted by display name (see build_projects_by_parent())
         level: Maximum depth to display (None for unlimited)
         current_depth: Current depth in the tree
         show_ids: Whether to show resource IDs
+        folders_by_parent: Dict mapping parent names to folder lists,
+            pre-sorted by display name; built once from the hierarchy when
+            not given
     """
     if level is not None and current_depth >= level:
         return
 
-    parent_name = (
-        current_node.name
-        if hasattr(current_node, "name")
-        else current_node.organization.name
-    )
-
-    # Projects
-    children_projects = projects_by_parent.get(parent_name, [])
-    children_projects.sort(key=lambda x: x.display_name)
+    if folders_by_parent is None:
+        folders_by_parent = build_folders_by_parent(hierarchy)
 
-    # Folders - find direct children using the parent field
-    children_folders = []
-    org_node_ref = (
-        current_node
+    parent_name = (
+        current_node.organization.name
         if isinstance(current_node, OrganizationNode)
-        else current_node.organization
+        else current_node.name
     )
 
-    if org_node_ref:
-        for f in org_node_ref.folders.values():
-            # Use the parent field to find direct children
-            if f.parent == parent_name:
-                children_folders.append(f)
-
-    children_folders.sort(key=lambda x: x.display_name)
-
-    for f in children_folders:
-        label = format_tree_label(f, show_ids)
-        sub_node = tree_node.add(label)
-        build_tree_view(
-            sub_node,
-            f,
-            hierarchy,
-            projects_by_parent,
-            level,
-            current_depth + 1,
-            show_ids,
-        )
-
-    for p in children_projects:
-        label = format_tree_label(p, show_ids)
-        tree_node.add(label)
+    # Bind lookups used for every visited node to locals
+    get_folders = folders_by_parent.get
+    get_projects = projects_by_parent.get
+    make_label = format_tree_label
+    stack = [(tree_node, parent_name, current_depth)]
+    push = stack.append
+    pop = stack.pop
+
+    while stack:
+        node, parent_name, depth = pop()
+        if level is not None and depth >= level:
+            continue
+
+        # Both indexes are pre-sorted by display name
+        add = node.add
+        for f in get_folders(parent_name, ()):
+            sub_node = add(make_label(f, show_ids))
+            # Leaf folders have nothing to expand, so never queue them
+            if f.name in folders_by_parent or f.name in projects_by_parent:
+                push((sub_node, f.name, depth + 1))
+
+        for p in get_projects(parent_name, ()):
+            add(make_label(p, show_ids))
@@ -4,8 +4,14 @@ GCP Resource loading utilities.
 This module handles loading resources from GCP via Resource Manager and Asset APIs.
 """
 
+import collections
+import datetime
+import functools
 import logging
-from typing import List, Optional
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 from google.cloud import resourcemanager_v3, asset_v1  # type: ignore
 from google.api_core import exceptions
@@ -16,42 +22,175 @@ from gcpath.parsers import (
     build_folder_ancestors,
 )
 
+if TYPE_CHECKING:
+    from gcpath.core import Project
+
 logger = logging.getLogger(__name__)
 
+# Concurrent list_folders() calls when walking the hierarchy via Resource Manager
+FOLDER_LIST_MAX_WORKERS = 16
+
+# Rows per Asset API result page (the service caps pages at 1000 rows / 10 MB),
+# so large results stream in bounded pages instead of one large response
+ASSET_QUERY_PAGE_SIZE = 1000
+
+# How long the service holds each query_assets call open waiting for the query
+# to finish, before it returns an unfinished job to poll
+ASSET_QUERY_TIMEOUT = datetime.timedelta(seconds=20)
+
+# Capped exponential backoff between polls of an unfinished Asset query job,
+# and the total time to wait for it before giving up
+ASSET_QUERY_POLL_INITIAL_DELAY = 1.0
+ASSET_QUERY_POLL_MAX_DELAY = 10.0
+ASSET_QUERY_MAX_WAIT_SECONDS = 300.0
+
+# Parent prefixes of projects that belong to an organization
+_ORG_ROOTED_PREFIXES = ("organizations/", "folders/")
+
+# Server-side filter for search_projects() that leaves out projects under an
+# organization or folder, which the per-org Asset queries already cover. It
+# only narrows the search: results are still filtered locally by parent, and a
+# rejected query falls back to listing every accessible project.
+_ORGLESS_PROJECTS_QUERY = "-parent:organizations/* -parent:folders/*"
+
+# Asset API SQL templates. Filters are validated by _sql_literal() before they
+# are substituted, since they end up inside quoted SQL literals.
+_SQL_LITERAL_RE = re.compile(r"[A-Za-z0-9_/-]+")
+
+_FOLDER_BASE_QUERY = (
+    "SELECT name, resource.data.displayName, resource.data.parent, ancestors "
+    "FROM `cloudresourcemanager_googleapis_com_Folder` "
+    "WHERE resource.data.lifecycleState = 'ACTIVE'"
+)
+_FOLDER_BY_NAME_QUERY = (
+    _FOLDER_BASE_QUERY + " AND name = '//cloudresourcemanager.googleapis.com/{name}'"
+)
+_FOLDER_BY_PARENT_QUERY = _FOLDER_BASE_QUERY + " AND resource.data.parent = '{parent}'"
+# Use IN UNNEST() for array membership and exclude the ancestor folder itself
+_FOLDER_BY_ANCESTOR_QUERY = (
+    _FOLDER_BASE_QUERY + " AND '{ancestor}' IN UNNEST(ancestors) "
+    "AND name != '//cloudresourcemanager.googleapis.com/{ancestor}'"
+)
+
+_PROJECT_BASE_QUERY = (
+    "SELECT name, resource.data.projectId, resource.data.parent, ancestors "
+    "FROM `cloudresourcemanager_googleapis_com_Project` "
+    "WHERE resource.data.lifecycleState = 'ACTIVE'"
+)
+_PROJECT_BY_PARENT_QUERY = (
+    _PROJECT_BASE_QUERY + " AND resource.data.parent.id = '{parent_id}'"
+)
+_PROJECT_BY_ANCESTOR_QUERY = (
+    _PROJECT_BASE_QUERY + " AND '{ancestor}' IN UNNEST(ancestors)"
+)
+
+
+# Client construction does credential discovery and channel setup, so each
+# client is created once per process and shared by every loader call.
+@functools.lru_cache(maxsize=None)
+def get_organizations_client() -> resourcemanager_v3.OrganizationsClient:
+    """Return the shared Resource Manager OrganizationsClient."""
+    return resourcemanager_v3.OrganizationsClient()
+
+
+@functools.lru_cache(maxsize=None)
+def get_folders_client() -> resourcemanager_v3.FoldersClient:
+    """Return the shared Resource Manager FoldersClient."""
+    return resourcemanager_v3.FoldersClient()
+
+
+@functools.lru_cache(maxsize=None)
+def get_projects_client() -> resourcemanager_v3.ProjectsClient:
+    """Return the shared Resource Manager ProjectsClient."""
+    return resourcemanager_v3.ProjectsClient()
+
+
+@functools.lru_cache(maxsize=None)
+def get_asset_client() -> asset_v1.AssetServiceClient:
+    """Return the shared Cloud Asset AssetServiceClient."""
+    return asset_v1.AssetServiceClient()
+
+
+def clear_clients() -> None:
+    """Drop the shared clients and cached folder lookups so calls start fresh."""
+    get_organizations_client.cache_clear()
+    get_folders_client.cache_clear()
+    get_projects_client.cache_clear()
+    get_asset_client.cache_clear()
+    _get_folder_proto.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_folder_proto(name: str) -> resourcemanager_v3.Folder:
+    """Fetch a folder with get_folder(), memoized for the life of the clients.
+
+    Folder parents rarely change within a run, so repeated scope loads reuse
+    the already fetched chain instead of issuing one RPC per ancestor again.
+    """
+    return get_folders_client().get_folder(name=name)
+
+
+def is_asset_query_literal(value: str) -> bool:
+    """Check whether a resource name or ID can be embedded in an Asset SQL literal.
+
+    Args:
+        value: Resource name (e.g., "folders/123") or bare ID
+
+    Returns:
+        True if the value only contains characters in [A-Za-z0-9_/-]
+    """
+    return _SQL_LITERAL_RE.fullmatch(value) is not None
+
+
+def _sql_literal(value: str) -> str:
+    """Validate a resource name or ID before embedding it in an Asset SQL literal.
+
+    Args:
+        value: Resource name (e.g., "folders/123") or bare ID
+
+    Returns:
+        The value unchanged
+
+    Raises:
+        ValueError: If the value contains characters outside [A-Za-z0-9_/-]
+    """
+    if not is_asset_query_literal(value):
+        raise ValueError(f"Invalid resource name for Asset API query: {value!r}")
+    return value
+
 
 def build_folder_sql_query(
-    parent_filter: Optional[str] = None, ancestors_filter: Optional[str] = None
+    parent_filter: Optional[str] = None,
+    ancestors_filter: Optional[str] = None,
+    name_filter: Optional[str] = None,
 ) -> str:
     """Build SQL query for loading folders from Asset API.
 
     Args:
         parent_filter: Only load folders directly under this parent
         ancestors_filter: Only load folders with this resource in their ancestors
+        name_filter: Only load the folder with this resource name
 
     Returns:
         SQL query string for Asset API
-    """
-    base_query = (
-        "SELECT name, resource.data.displayName, resource.data.parent, ancestors "
-        "FROM `cloudresourcemanager_googleapis_com_Folder` "
-        "WHERE resource.data.lifecycleState = 'ACTIVE'"
-    )
 
-    if parent_filter:
+    Raises:
+        ValueError: If a filter is not a plain resource name
+    """
+    if name_filter:
+        # Single folder lookup, e.g. the scope folder with its full ancestry
+        return _FOLDER_BY_NAME_QUERY.format(name=_sql_literal(name_filter))
+    elif parent_filter:
         # Scoped query: only direct children of the specified parent
-        return f"{base_query} AND resource.data.parent = '{parent_filter}'"
+        return _FOLDER_BY_PARENT_QUERY.format(parent=_sql_literal(parent_filter))
     elif ancestors_filter:
         # Recursive query: all descendants of the specified ancestor
-        # Use IN UNNEST() for array membership check in BigQuery SQL
-        # Exclude the ancestor folder itself from results
-        return (
-            f"{base_query} "
-            f"AND '{ancestors_filter}' IN UNNEST(ancestors) "
-            f"AND name != '//cloudresourcemanager.googleapis.com/{ancestors_filter}'"
+        return _FOLDER_BY_ANCESTOR_QUERY.format(
+            ancestor=_sql_literal(ancestors_filter)
         )
     else:
         # Unscoped query: all folders under the org
-        return base_query
+        return _FOLDER_BASE_QUERY
 
 
 def build_project_sql_query(
@@ -65,68 +204,74 @@ def build_project_sql_query(
 
     Returns:
         SQL query string for Asset API
-    """
-    base_query = (
-        "SELECT name, resource.data.projectNumber, resource.data.projectId, "
-        "resource.data.parent, ancestors "
-        "FROM `cloudresourcemanager_googleapis_com_Project` "
-        "WHERE resource.data.lifecycleState = 'ACTIVE'"
-    )
 
+    Raises:
+        ValueError: If a filter is not a plain resource name
+    """
     if parent_filter:
         # Scoped query: only direct children of the specified parent
         # Note: parent is a STRUCT with 'type' and 'id' fields
         parent_id = parent_filter.split("/")[-1]
-        return f"{base_query} AND resource.data.parent.id = '{parent_id}'"
+        return _PROJECT_BY_PARENT_QUERY.format(parent_id=_sql_literal(parent_id))
     elif ancestors_filter:
         # Recursive query: all descendants of the specified ancestor
-        # Use IN UNNEST() for array membership check in BigQuery SQL
-        return f"{base_query} AND '{ancestors_filter}' IN UNNEST(ancestors)"
+        return _PROJECT_BY_ANCESTOR_QUERY.format(
+            ancestor=_sql_literal(ancestors_filter)
+        )
     else:
         # Unscoped query: all projects under the org
-        return base_query
+        return _PROJECT_BASE_QUERY
 
 
 def load_folders_rm(node, org_name: str):
-    """Load folders using Resource Manager API (recursive calls).
+    """Load folders using Resource Manager API (iterative walk, no recursion).
 
     Args:
         node: OrganizationNode to load folders into
         org_name: Organization resource name for ancestry
 
-    Note: This function uses recursive API calls and is slower than Asset API.
-          Prefer load_folders_asset() for better performance.
+    Note: This function issues one list_folders() call per folder and is
+          slower than Asset API. Sibling subtrees are listed concurrently on
+          a thread pool. Prefer load_folders_asset() for better performance.
     """
-    folders_client = resourcemanager_v3.FoldersClient()
+    folders_client = get_folders_client()
+
+    # Import Folder class locally to avoid circular dependency
+    from gcpath.core import Folder
 
-    def recurse(parent_name: str, ancestors: List[str]):
+    def list_children(parent_name: str, ancestors: List[str]) -> List[Folder]:
         request = resourcemanager_v3.ListFoldersRequest(parent=parent_name)
+        children = []
         try:
             page = folders_client.list_folders(request=request)
             logger.debug(f"GCP API: list_folders() returned for {parent_name}")
 
-            # Import Folder class locally to avoid circular dependency
-            from gcpath.core import Folder
-
             for folder_proto in page:
                 # ancestors list includes: [folder.Name, parent..., OrgName]
-                new_ancestors = [folder_proto.name] + ancestors
-
-                f = Folder(
-                    name=folder_proto.name,
-                    display_name=folder_proto.display_name,
-                    ancestors=new_ancestors,
-                    organization=node,
-                    parent=parent_name,  # The parent we're listing under
+                children.append(
+                    Folder(
+                        name=folder_proto.name,
+                        display_name=folder_proto.display_name,
+                        ancestors=[folder_proto.name] + ancestors,
+                        organization=node,
+                        parent=parent_name,  # The parent we're listing under
+                    )
                 )
-                node.folders[f.name] = f
-                recurse(f.name, new_ancestors)
         except exceptions.PermissionDenied:
             logger.warning(f"Permission denied listing folders for {parent_name}")
+        return children
 
-    # Start recursion with Org
-    # ancestors initially just the Org
-    recurse(org_name, [org_name])
+    # Start with Org, ancestors initially just the Org. Workers only list;
+    # node.folders is written from this thread alone.
+    with ThreadPoolExecutor(max_workers=FOLDER_LIST_MAX_WORKERS) as executor:
+        pending = {executor.submit(list_children, org_name, [org_name])}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for f in future.result():
+                    node.folders[f.name] = f
+                    pending.add(executor.submit(list_children, f.name, f.ancestors))
+    node.reset_path_index()
 
 
 def fix_folder_ancestors(node):
@@ -136,43 +281,63 @@ def fix_folder_ancestors(node):
         node: OrganizationNode containing folders to fix
 
     Note: This is needed because Asset API returns empty ancestors for full
-          recursive loads. We build the full chain by traversing parents.
+          recursive loads. We build the full chain by traversing parents,
+          memoizing each folder's chain so shared ancestors are walked once.
     """
-    for folder in list(node.folders.values()):
-        # Only fix if this folder has a folder parent and ancestors seem incomplete
-        if not folder.parent.startswith("folders/"):
-            continue
-
-        # Build full ancestor chain by traversing parents
-        ancestors = [folder.name]
-        current_parent = folder.parent
-        visited = {folder.name}  # Prevent infinite loops
-
-        while current_parent and current_parent.startswith("folders/"):
-            if current_parent in visited:
-                logger.warning(f"Circular parent reference detected for {folder.name}")
+    folders = node.folders
+    org_name = node.organization.name
+    # Classify each folder's parent once: only folders nested under another
+    # folder need their chains rebuilt, and only those continue a parent walk
+    folder_parents = {
+        name: folder.parent
+        for name, folder in folders.items()
+        if folder.parent.startswith("folders/")
+    }
+    # Folder name -> chain from that folder up through its known folders to the org
+    chains: Dict[str, Tuple[str, ...]] = {}
+    org_chain = (org_name,)
+
+    def chain_of(name: str) -> Tuple[str, ...]:
+        path: List[str] = []
+        on_path = set()
+        current = name
+        while True:
+            if current in chains:
+                base = chains[current]
                 break
-            visited.add(current_parent)
-            ancestors.append(current_parent)
-
-            # Look up the parent to continue the chain
-            if current_parent in node.folders:
-                parent_folder = node.folders[current_parent]
-                current_parent = parent_folder.parent
-            else:
-                # Parent not in folders, stop here
+            if current in on_path:
+                logger.warning(f"Circular parent reference detected for {name}")
+                base = org_chain
                 break
+            path.append(current)
+            on_path.add(current)
 
-        # Add org at the end
-        if not ancestors[-1].startswith("organizations/"):
-            ancestors.append(node.organization.name)
-
-        # Update if the ancestors changed
-        if ancestors != folder.ancestors:
-            folder.ancestors = ancestors
+            # Look up the parent to continue the chain; stop at unknown parents
+            parent = folder_parents.get(current)
+            if parent is None:
+                base = org_chain
+                break
+            current = parent
+
+        # Fill in the chains of every folder walked, deepest ancestor first
+        for n in reversed(path):
+            base = (n,) + base
+            chains[n] = base
+        return chains[name]
+
+    for name in folder_parents:
+        folder = folders[name]
+        ancestors = chain_of(name)
+
+        # Only build a new list if the ancestors changed (usually they don't)
+        if tuple(folder.ancestors) != ancestors:
+            folder.ancestors = list(ancestors)
+            folder.reset_path()
             logger.debug(
-                f"Fixed ancestors for {folder.name} ({folder.display_name}): {ancestors}"
+                f"Fixed ancestors for {folder.name} ({folder.display_name}): "
+                f"{folder.ancestors}"
             )
+    node.reset_path_index()
 
 
 def load_scope_folder(node, scope_resource: str):
@@ -184,7 +349,9 @@ def load_scope_folder(node, scope_resource: str):
 
     Note: When doing recursive scoped load, the scope folder itself is excluded
           from results. We need to load it separately so projects can find their
-          parent folder.
+          parent folder. The Asset API returns the folder with its complete
+          ancestry in one query; walking the parent chain with get_folder() is
+          only the fallback.
     """
     if scope_resource in node.folders:
         # Already loaded
@@ -194,9 +361,79 @@ def load_scope_folder(node, scope_resource: str):
         f"Recursive scoped load: loading scope folder {scope_resource} separately"
     )
 
+    folder_obj = _load_scope_folder_asset(node, scope_resource)
+    if folder_obj is None:
+        folder_obj = _load_scope_folder_rm(node, scope_resource)
+    if folder_obj is None:
+        return
+
+    node.folders[folder_obj.name] = folder_obj
+    node.reset_path_index()
+    logger.debug(
+        f"Added scope folder {scope_resource} with ancestors {folder_obj.ancestors}"
+    )
+
+
+def _load_scope_folder_asset(node, scope_resource: str):
+    """Fetch the scope folder and its full ancestry with a single Asset query.
+
+    Args:
+        node: OrganizationNode the folder belongs to
+        scope_resource: Folder resource name to load
+
+    Returns:
+        Folder object, or None if the query failed or returned no usable row
+    """
+    # Import Folder class locally to avoid circular dependency
+    from gcpath.core import Folder
+
+    org_name = node.organization.name
+    query_request = asset_v1.QueryAssetsRequest(
+        parent=org_name,
+        statement=build_folder_sql_query(name_filter=scope_resource),
+        page_size=ASSET_QUERY_PAGE_SIZE,
+        timeout=ASSET_QUERY_TIMEOUT,
+    )
+
     try:
-        folders_client = resourcemanager_v3.FoldersClient()
-        folder_proto = folders_client.get_folder(name=scope_resource)
+        for row in _iter_query_rows(get_asset_client(), query_request, "folder"):
+            folder_data = parse_folder_row(row)
+            ancestors = folder_data["ancestors"]
+            # Only trust a chain that runs from the folder up to this org
+            if not ancestors or ancestors[-1] != org_name:
+                logger.debug(
+                    f"Incomplete ancestors for scope folder {scope_resource}: "
+                    f"{ancestors}"
+                )
+                return None
+            if ancestors[0] != folder_data["name"]:
+                ancestors = [folder_data["name"]] + ancestors
+
+            return Folder(
+                name=folder_data["name"],
+                display_name=folder_data["display_name"],
+                ancestors=ancestors,
+                organization=node,
+                parent=folder_data["parent"] or ancestors[1],
+            )
+    except Exception as e:
+        logger.debug(f"Asset lookup of scope folder {scope_resource} failed: {e}")
+
+    return None
+
+
+def _load_scope_folder_rm(node, scope_resource: str):
+    """Fetch the scope folder by walking its parent chain with get_folder().
+
+    Args:
+        node: OrganizationNode the folder belongs to
+        scope_resource: Folder resource name to load
+
+    Returns:
+        Folder object, or None if the folder could not be fetched
+    """
+    try:
+        folder_proto = _get_folder_proto(scope_resource)
 
         # Import Folder class locally to avoid circular dependency
         from gcpath.core import Folder
@@ -212,18 +449,16 @@ def load_scope_folder(node, scope_resource: str):
                 # Use the loaded parent's ancestors
                 loaded_folder = node.folders[current_parent]
                 # Add remaining ancestors from parent (excluding the parent itself)
-                ancestors_chain.extend(
-                    [
-                        a
-                        for a in loaded_folder.ancestors
-                        if a != current_parent and a not in ancestors_chain
-                    ]
-                )
+                seen = set(ancestors_chain)
+                for a in loaded_folder.ancestors:
+                    if a not in seen:
+                        ancestors_chain.append(a)
+                        seen.add(a)
                 break
             else:
                 # Fetch the parent folder
                 try:
-                    parent_proto = folders_client.get_folder(name=current_parent)
+                    parent_proto = _get_folder_proto(current_parent)
                     current_parent = parent_proto.parent
                 except Exception:
                     break
@@ -232,19 +467,16 @@ def load_scope_folder(node, scope_resource: str):
         if not ancestors_chain or ancestors_chain[-1] != node.organization.name:
             ancestors_chain.append(node.organization.name)
 
-        folder_obj = Folder(
+        return Folder(
             name=folder_proto.name,
             display_name=folder_proto.display_name,
             ancestors=ancestors_chain,
             organization=node,
             parent=folder_proto.parent,
         )
-        node.folders[folder_proto.name] = folder_obj
-        logger.debug(
-            f"Added scope folder {scope_resource} with ancestors {ancestors_chain}"
-        )
     except Exception as e:
         logger.warning(f"Could not load scope folder {scope_resource}: {e}")
+        return None
 
 
 def load_folders_asset(
@@ -260,7 +492,7 @@ def load_folders_asset(
     Note: parent_filter and ancestors_filter are mutually exclusive.
           If neither is provided, loads ALL folders under the org.
     """
-    asset_client = asset_v1.AssetServiceClient()
+    asset_client = get_asset_client()
 
     # Build SQL query
     statement = build_folder_sql_query(parent_filter, ancestors_filter)
@@ -269,159 +501,286 @@ def load_folders_asset(
     query_request = asset_v1.QueryAssetsRequest(
         parent=node.organization.name,
         statement=statement,
+        page_size=ASSET_QUERY_PAGE_SIZE,
+        timeout=ASSET_QUERY_TIMEOUT,
     )
 
-    response = asset_client.query_assets(request=query_request)
-    logger.debug(
-        f"GCP API: query_assets(folders) returned for {node.organization.name}"
-    )
-
-    # Iterate directly over the response (pagination is handled automatically)
-    if not response.query_result or not response.query_result.rows:
-        logger.debug("No folder rows returned from Asset API")
-        return
-
     # Import Folder class locally to avoid circular dependency
     from gcpath.core import Folder
 
-    for row in response.query_result.rows:
-        try:
-            # Parse the folder row using parsers module
-            folder_data = parse_folder_row(row)
+    # Loop invariants, looked up once rather than per row
+    org_name = node.organization.name
+    fallback_parent = parent_filter if parent_filter else org_name
 
-            # Get the parent - either from the API response or from parent_filter
-            folder_parent = (
-                folder_data["parent"]
-                if folder_data["parent"]
-                else (parent_filter if parent_filter else node.organization.name)
-            )
+    # Build the new folders locally and publish them to node.folders in one
+    # update; parent lookups see both the new and any previously loaded folders
+    new_folders: Dict[str, Folder] = {}
+    known_folders = (
+        collections.ChainMap(new_folders, node.folders) if node.folders else new_folders
+    )
 
-            # Build complete ancestor chain
-            ancestors = build_folder_ancestors(
-                folder_data["name"],
-                folder_data["ancestors"],
-                folder_parent,
-                node.folders,
-                node.organization.name,
-            )
+    # Rows are parsed page by page as they arrive
+    try:
+        for row in _iter_query_rows(asset_client, query_request, "folder"):
+            try:
+                # Parse the folder row using parsers module
+                folder_data = parse_folder_row(row)
+
+                # Get the parent - either from the API response or from parent_filter
+                folder_parent = folder_data["parent"] or fallback_parent
+
+                # Build complete ancestor chain
+                ancestors = build_folder_ancestors(
+                    folder_data["name"],
+                    folder_data["ancestors"],
+                    folder_parent,
+                    known_folders,
+                    org_name,
+                )
 
-            f = Folder(
-                name=folder_data["name"],
-                display_name=folder_data["display_name"],
-                ancestors=ancestors,
-                organization=node,
-                parent=folder_parent,
-            )
-            node.folders[f.name] = f
+                f = Folder(
+                    name=folder_data["name"],
+                    display_name=folder_data["display_name"],
+                    ancestors=ancestors,
+                    organization=node,
+                    parent=folder_parent,
+                )
+                new_folders[f.name] = f
 
-        except (ValueError, KeyError) as e:
-            logger.warning(f"Error parsing folder row: {e}")
-            continue
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Error parsing folder row: {e}")
+                continue
+    finally:
+        # Folders parsed before a failed query are still published
+        node.folders.update(new_folders)
+        node.reset_path_index()
 
     # Second pass: fix up ancestors for all folders by traversing parent chain
     fix_folder_ancestors(node)
 
 
-def load_projects_asset(
-    node, parent_filter: Optional[str] = None, ancestors_filter: Optional[str] = None
-):
-    """Load projects from Asset API.
+def _iter_raw_rows(response, row_type: str) -> Iterator[Any]:
+    """Yield the rows of an Asset API query response.
 
     Args:
-        node: OrganizationNode to associate projects with
-        parent_filter: Only load projects directly under this parent
-        ancestors_filter: Only load projects with this resource in their ancestors
+        response: Response returned by query_assets()
+        row_type: Type of row for log messages (e.g., "project", "folder")
 
-    Returns:
-        List of Project objects
+    Yields:
+        Raw rows from the query result (nothing if the result is empty)
+    """
+    if not response.query_result or not response.query_result.rows:
+        logger.debug(f"No {row_type} rows returned from Asset API")
+        logger.debug(f"Query result: {response.query_result}")
+        return
 
-    Note: parent_filter and ancestors_filter are mutually exclusive.
-          If neither is provided, loads ALL projects under the org.
+    yield from response.query_result.rows
+
+
+def _iter_query_rows(asset_client, query_request, row_type: str) -> Iterator[Any]:
+    """Run an Asset API query and yield its rows across all result pages.
+
+    Long-running queries return a job reference before they are done, and
+    large results are split into pages. Both are followed by reissuing the
+    request with the job reference (and page token), so callers can consume
+    the first page while later ones are still being fetched. Unfinished jobs
+    are polled with capped exponential backoff for at most
+    ASSET_QUERY_MAX_WAIT_SECONDS.
+
+    Args:
+        asset_client: AssetServiceClient to query with
+        query_request: Initial QueryAssetsRequest carrying the SQL statement
+        row_type: Type of row for log messages (e.g., "project", "folder")
+
+    Yields:
+        Raw rows from every page of the query result
+
+    Raises:
+        google.api_core.exceptions.DeadlineExceeded: If the job is still not done
+            after ASSET_QUERY_MAX_WAIT_SECONDS
+        google.api_core.exceptions.InternalServerError: If an unfinished job
+            comes back without a job reference to poll
     """
+    parent = query_request.parent
+    page_size = query_request.page_size
+    deadline = time.monotonic() + ASSET_QUERY_MAX_WAIT_SECONDS
+    delay = ASSET_QUERY_POLL_INITIAL_DELAY
+    while True:
+        response = asset_client.query_assets(request=query_request)
+        logger.debug(f"GCP API: query_assets({row_type}s) returned for {parent}")
+
+        page_token = ""
+        if response.done:
+            yield from _iter_raw_rows(response, row_type)
+            if response.query_result:
+                page_token = response.query_result.next_page_token
+            if not page_token:
+                return
+        else:
+            if not response.job_reference:
+                raise exceptions.InternalServerError(
+                    f"Asset API {row_type} query for {parent} is not done "
+                    "and returned no job reference"
+                )
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise exceptions.DeadlineExceeded(
+                    f"Asset API {row_type} query for {parent} did not finish "
+                    f"within {ASSET_QUERY_MAX_WAIT_SECONDS:.0f}s"
+                )
+            logger.debug(
+                f"Asset API {row_type} query for {parent} pending, "
+                f"polling again in {min(delay, remaining):.1f}s"
+            )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, ASSET_QUERY_POLL_MAX_DELAY)
+
+        query_request = asset_v1.QueryAssetsRequest(
+            parent=parent,
+            job_reference=response.job_reference,
+            page_size=page_size,
+            page_token=page_token,
+            timeout=ASSET_QUERY_TIMEOUT,
+        )
+
+
+def _iter_parsed_projects(
+    rows: Iterable[Any], node, parent_filter: Optional[str] = None
+) -> Iterator["Project"]:
+    """Parse Asset API project rows into Project objects.
+
+    Args:
+        rows: Raw project rows from the Asset API
+        node: OrganizationNode to associate projects with
+        parent_filter: Parent used as fallback when a row carries no parent
+
+    Yields:
+        Project objects; rows that fail to parse are logged and skipped
+    """
+    # Import Project class locally to avoid circular dependency
     from gcpath.core import Project
 
-    asset_client = asset_v1.AssetServiceClient()
-    projects: List[Project] = []
+    # Loop invariants, looked up once rather than per row
+    fallback_parent = parent_filter if parent_filter else node.organization.name
+    get_folder = node.folders.get
 
-    # Build SQL query
-    statement = build_project_sql_query(parent_filter, ancestors_filter)
+    for row in rows:
+        try:
+            # Parse the project row using parsers module
+            project_data = parse_project_row(row)
+            ancestors = project_data["ancestors"]
+
+            # Determine parent - prefer from API, then ancestors, then fallback
+            if project_data["parent"]:
+                parent_res = project_data["parent"]
+            elif not ancestors:
+                # No ancestors and no parent from API - use parent_filter if set, otherwise org
+                parent_res = fallback_parent
+            elif ancestors[0] == project_data["name"]:
+                parent_res = ancestors[1] if len(ancestors) > 1 else fallback_parent
+            else:
+                parent_res = ancestors[0]
 
+            # node.folders is keyed by "folders/ID", so non-folder parents miss
+            parent_folder = get_folder(parent_res)
+
+            proj = Project(
+                name=project_data["name"],
+                project_id=project_data["project_id"],
+                display_name=project_data["display_name"],
+                parent=parent_res,
+                organization=node,
+                folder=parent_folder,
+            )
+            logger.debug(
+                f"Added project {project_data['project_id']} to hierarchy "
+                f"from Asset API (parent: {parent_res})"
+            )
+            yield proj
+
+        except (ValueError, KeyError, IndexError, AttributeError, TypeError) as e:
+            logger.warning(f"Error parsing Asset API project row: {e}")
+            continue
+
+
+def _project_query_request(
+    node, parent_filter: Optional[str], ancestors_filter: Optional[str]
+) -> asset_v1.QueryAssetsRequest:
+    """Build the Asset API request for an organization's projects."""
+    statement = build_project_sql_query(parent_filter, ancestors_filter)
     logger.debug(f"Projects query: {statement}")
-    query_request = asset_v1.QueryAssetsRequest(
+    return asset_v1.QueryAssetsRequest(
         parent=node.organization.name,
         statement=statement,
+        page_size=ASSET_QUERY_PAGE_SIZE,
+        timeout=ASSET_QUERY_TIMEOUT,
     )
 
+
+def fetch_project_rows_asset(
+    node, parent_filter: Optional[str] = None, ancestors_filter: Optional[str] = None
+) -> List[Any]:
+    """Run the Asset API projects query and collect its raw rows.
+
+    The query does not depend on the folders, so it can run while they are
+    still loading; pass the rows to load_projects_asset afterwards.
+
+    Args:
+        node: OrganizationNode to query projects for
+        parent_filter: Only load projects directly under this parent
+        ancestors_filter: Only load projects with this resource in their ancestors
+
+    Returns:
+        Raw project rows (the pages fetched before an error, if the query failed)
+    """
+    rows: List[Any] = []
     try:
-        response = asset_client.query_assets(request=query_request)
-        logger.debug(
-            f"GCP API: query_assets(projects) returned for {node.organization.name}"
+        rows.extend(
+            _iter_query_rows(
+                get_asset_client(),
+                _project_query_request(node, parent_filter, ancestors_filter),
+                "project",
+            )
         )
+    except Exception as e:
+        logger.error(f"Error querying projects via Asset API: {e}")
+    return rows
 
-        # Iterate directly over the response
-        if not response.query_result or not response.query_result.rows:
-            logger.debug("No project rows returned from Asset API")
-            logger.debug(f"Query result: {response.query_result}")
-            return projects
 
-        # Import Project class locally to avoid circular dependency
-        from gcpath.core import Project
+def load_projects_asset(
+    node,
+    parent_filter: Optional[str] = None,
+    ancestors_filter: Optional[str] = None,
+    rows: Optional[Iterable[Any]] = None,
+):
+    """Load projects from Asset API.
 
-        for row in response.query_result.rows:
-            try:
-                # Parse the project row using parsers module
-                project_data = parse_project_row(row)
-
-                # Determine parent - prefer from API, then ancestors, then fallback
-                if project_data["parent"]:
-                    parent_res = project_data["parent"]
-                elif not project_data["ancestors"]:
-                    # No ancestors and no parent from API - use parent_filter if set, otherwise org
-                    parent_res = (
-                        parent_filter if parent_filter else node.organization.name
-                    )
-                elif (
-                    project_data["ancestors"]
-                    and project_data["ancestors"][0] == project_data["name"]
-                ):
-                    parent_res = (
-                        project_data["ancestors"][1]
-                        if len(project_data["ancestors"]) > 1
-                        else (
-                            parent_filter if parent_filter else node.organization.name
-                        )
-                    )
-                else:
-                    parent_res = (
-                        project_data["ancestors"][0]
-                        if project_data["ancestors"]
-                        else (
-                            parent_filter if parent_filter else node.organization.name
-                        )
-                    )
+    Args:
+        node: OrganizationNode to associate projects with
+        parent_filter: Only load projects directly under this parent
+        ancestors_filter: Only load projects with this resource in their ancestors
+        rows: Rows already fetched by fetch_project_rows_asset. If omitted,
+              the query is run here and its pages are parsed as they arrive.
 
-                parent_folder = None
-                if parent_res.startswith("folders/"):
-                    parent_folder = node.folders.get(parent_res)
+    Returns:
+        List of Project objects
 
-                proj = Project(
-                    name=project_data["name"],
-                    project_id=project_data["project_id"],
-                    display_name=project_data["display_name"],
-                    parent=parent_res,
-                    organization=node,
-                    folder=parent_folder,
-                )
-                logger.debug(
-                    f"Added project {project_data['project_id']} to hierarchy "
-                    f"from Asset API (parent: {parent_res})"
-                )
-                projects.append(proj)
+    Note: parent_filter and ancestors_filter are mutually exclusive.
+          If neither is provided, loads ALL projects under the org.
+    """
+    projects: List["Project"] = []
 
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Error parsing project row: {e}")
-                continue
+    if rows is None:
+        rows = _iter_query_rows(
+            get_asset_client(),
+            _project_query_request(node, parent_filter, ancestors_filter),
+            "project",
+        )
 
+    # Malformed rows are skipped individually inside the generator; a failed
+    # query keeps whatever pages were already parsed
+    try:
+        projects.extend(_iter_parsed_projects(rows, node, parent_filter))
     except Exception as e:
         logger.error(f"Error querying projects via Asset API: {e}")
 
@@ -442,7 +801,7 @@ def load_organizationless_projects(existing_project_names: set):
           Manager search_projects API.
     """
     projects = []
-    project_client = resourcemanager_v3.ProjectsClient()
+    project_client = get_projects_client()
 
     logger.debug(
         f"Falling back to search_projects() to find organizationless projects. "
@@ -453,32 +812,40 @@ def load_organizationless_projects(existing_project_names: set):
     from gcpath.core import Project
 
     try:
-        projects_pager = project_client.search_projects(
-            request=resourcemanager_v3.SearchProjectsRequest()
-        )
+        try:
+            projects_pager = project_client.search_projects(
+                request=resourcemanager_v3.SearchProjectsRequest(
+                    query=_ORGLESS_PROJECTS_QUERY
+                )
+            )
+        except exceptions.InvalidArgument:
+            logger.debug("search_projects() rejected the parent filter, listing all")
+            projects_pager = project_client.search_projects(
+                request=resourcemanager_v3.SearchProjectsRequest()
+            )
         logger.debug("GCP API: search_projects() fallback returned successfully")
 
         for p_proto in projects_pager:
+            # Projects under an organization or folder were already covered by
+            # the per-org Asset queries; the server filter should have dropped
+            # them, but route out any that slip through before any lookup
+            if p_proto.parent.startswith(_ORG_ROOTED_PREFIXES):
+                continue
+
             if p_proto.name in existing_project_names:
                 logger.debug(f"Project {p_proto.project_id} already loaded, skipping")
                 continue
 
-            # A project is organizationless if it's not under an organization or folder
-            is_orgless = not p_proto.parent.startswith(
-                "organizations/"
-            ) and not p_proto.parent.startswith("folders/")
-
-            if is_orgless:
-                logger.debug(f"Found organizationless project: {p_proto.project_id}")
-                proj = Project(
-                    name=p_proto.name,
-                    project_id=p_proto.project_id,
-                    display_name=p_proto.display_name or p_proto.project_id,
-                    parent=p_proto.parent,
-                    organization=None,
-                    folder=None,
-                )
-                projects.append(proj)
+            logger.debug(f"Found organizationless project: {p_proto.project_id}")
+            proj = Project(
+                name=p_proto.name,
+                project_id=p_proto.project_id,
+                display_name=p_proto.display_name or p_proto.project_id,
+                parent=p_proto.parent,
+                organization=None,
+                folder=None,
+            )
+            projects.append(proj)
 
     except exceptions.PermissionDenied:
         logger.warning("Permission denied searching organizationless projects")
@@ -6,10 +6,24 @@ including STRUCT parsing, MapComposite handling, and row validation.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
+# Parent STRUCT types are a small closed set, so map them to their plural
+# resource-name prefix directly instead of re-deriving it for every row.
+_PARENT_TYPE_PLURAL = {
+    "organization": "organizations",
+    "folder": "folders",
+    "project": "projects",
+    "organizations": "organizations",
+    "folders": "folders",
+    "projects": "projects",
+}
+
+# Prefix the Asset API puts in front of Resource Manager resource names
+_ASSET_NAME_PREFIX = "//cloudresourcemanager.googleapis.com/"
+
 
 def clean_asset_name(name: str) -> str:
     """Strips the Asset API prefix from resource names.
@@ -20,10 +34,7 @@ def clean_asset_name(name: str) -> str:
     Returns:
         Cleaned resource name (e.g., "folders/123")
     """
-    prefix = "//cloudresourcemanager.googleapis.com/"
-    if name.startswith(prefix):
-        return name[len(prefix) :]
-    return name
+    return name.removeprefix(_ASSET_NAME_PREFIX)
 
 
 def extract_value(obj: Any) -> Any:
@@ -38,10 +49,10 @@ def extract_value(obj: Any) -> Any:
     Returns:
         Extracted value from 'v' field, or the object itself
     """
-    if hasattr(obj, "get"):
-        return obj.get("v")
-    elif isinstance(obj, dict):
-        return obj.get("v")
+    # One attribute lookup covers both dict and MapComposite
+    get = getattr(obj, "get", None)
+    if get is not None:
+        return get("v")
     return obj
 
 
@@ -54,12 +65,11 @@ def extract_list_values(ancestors_wrapper: Any) -> List[str]:
     Returns:
         List of cleaned ancestor resource names
     """
-    raw_ancestors_uncleaned = (
-        ancestors_wrapper if isinstance(ancestors_wrapper, list) else []
-    )
-    return [
-        clean_asset_name(str(extract_value(item))) for item in raw_ancestors_uncleaned
-    ]
+    if not isinstance(ancestors_wrapper, list):
+        return []
+    _extract = extract_value
+    _clean = clean_asset_name
+    return [_clean(str(_extract(item))) for item in ancestors_wrapper]
 
 
 def parse_parent_struct(parent_col: Any) -> Optional[str]:
@@ -78,31 +88,31 @@ def parse_parent_struct(parent_col: Any) -> Optional[str]:
     if not parent_struct_raw:
         return None
 
-    # Convert MapComposite to dict for easier access
-    parent_dict = dict(parent_struct_raw) if hasattr(parent_struct_raw, "keys") else {}
+    # Read "f" straight off the MapComposite instead of copying it into a dict
+    struct_fields = (
+        parent_struct_raw.get("f") if hasattr(parent_struct_raw, "keys") else None
+    )
 
     # Handle nested STRUCT format: {"f": [{"v": type}, {"v": id}]}
     if (
-        "f" in parent_dict
-        and hasattr(parent_dict["f"], "__len__")
-        and len(parent_dict["f"]) >= 2
+        struct_fields is not None
+        and hasattr(struct_fields, "__len__")
+        and len(struct_fields) >= 2
     ):
-        struct_fields = parent_dict["f"]
-
         type_val = extract_value(struct_fields[0])
         id_val = extract_value(struct_fields[1])
 
         if type_val and id_val:
-            parent_type_plural = (
-                f"{type_val}s" if not type_val.endswith("s") else type_val
+            parent_type_plural = _PARENT_TYPE_PLURAL.get(type_val) or (
+                type_val if type_val.endswith("s") else type_val + "s"
             )
             return f"{parent_type_plural}/{id_val}"
 
     return None
 
 
-def validate_row_structure(row: Any, expected_columns: int, row_type: str) -> bool:
-    """Validate Asset API row structure.
+def _row_columns(row: Any, expected_columns: int, row_type: str) -> Optional[Any]:
+    """Return the column list of an Asset API row if it is well formed.
 
     Args:
         row: Row from Asset API response
@@ -110,32 +120,45 @@ def validate_row_structure(row: Any, expected_columns: int, row_type: str) -> bo
         row_type: Type of row for error messages (e.g., "project", "folder")
 
     Returns:
-        True if valid, False otherwise
+        The row's "f" column list, or None if the row is malformed
     """
     try:
-        row_dict = dict(row)
-        if "f" not in row_dict:
+        f_list = row.get("f")
+        if f_list is None:
             logger.warning(f"Missing 'f' field in {row_type} row")
-            return False
+            return None
 
-        f_list = row_dict["f"]
         if len(f_list) < expected_columns:
             logger.warning(
                 f"Unexpected number of columns in Asset API {row_type} row: "
                 f"expected {expected_columns}, got {len(f_list)}"
             )
-            return False
+            return None
 
-        return True
+        return f_list
     except (TypeError, AttributeError) as e:
         logger.warning(f"Error validating {row_type} row structure: {e}")
-        return False
+        return None
+
+
+def validate_row_structure(row: Any, expected_columns: int, row_type: str) -> bool:
+    """Validate Asset API row structure.
+
+    Args:
+        row: Row from Asset API response
+        expected_columns: Expected number of columns
+        row_type: Type of row for error messages (e.g., "project", "folder")
+
+    Returns:
+        True if valid, False otherwise
+    """
+    return _row_columns(row, expected_columns, row_type) is not None
 
 
 def parse_project_row(row: Any) -> Dict[str, Any]:
     """Parse a project row from Asset API.
 
-    Expected columns: name, projectNumber, projectId, parent (STRUCT), ancestors
+    Expected columns: name, projectId, parent (STRUCT), ancestors
 
     Args:
         row: Project row from Asset API response
@@ -146,17 +169,16 @@ def parse_project_row(row: Any) -> Dict[str, Any]:
     Raises:
         ValueError: If row structure is invalid
     """
-    if not validate_row_structure(row, 5, "project"):
+    # Validation hands back the columns, so "f" is only looked up once per row
+    f_list = _row_columns(row, 4, "project")
+    if f_list is None:
         raise ValueError("Invalid project row structure")
 
-    row_dict = dict(row)
-    f_list = row_dict["f"]
-
-    # Extract columns: 0=name, 1=projectNumber, 2=projectId, 3=parent, 4=ancestors
+    # Extract columns: 0=name, 1=projectId, 2=parent, 3=ancestors
     name_val = extract_value(f_list[0])
-    project_id = extract_value(f_list[2])
-    parent_from_api = parse_parent_struct(f_list[3])
-    ancestors_wrapper = extract_value(f_list[4])
+    project_id = extract_value(f_list[1])
+    parent_from_api = parse_parent_struct(f_list[2])
+    ancestors_wrapper = extract_value(f_list[3])
 
     name = clean_asset_name(str(name_val))
     raw_ancestors = extract_list_values(ancestors_wrapper)
@@ -189,12 +211,10 @@ def parse_folder_row(row: Any) -> Dict[str, Any]:
     Raises:
         ValueError: If row structure is invalid or missing required fields
     """
-    if not validate_row_structure(row, 4, "folder"):
+    f_list = _row_columns(row, 4, "folder")
+    if f_list is None:
         raise ValueError("Invalid folder row structure")
 
-    row_dict = dict(row)
-    f_list = row_dict["f"]
-
     # Extract columns: 0=name, 1=displayName, 2=parent, 3=ancestors
     name_val = extract_value(f_list[0])
     display_name = extract_value(f_list[1])
@@ -225,7 +245,7 @@ def build_folder_ancestors(
     name: str,
     raw_ancestors: List[str],
     parent: str,
-    loaded_folders: Dict[str, Any],
+    loaded_folders: Mapping[str, Any],
     org_name: str,
 ) -> List[str]:
     """Build complete ancestor chain for a folder.
@@ -236,7 +256,7 @@ def build_folder_ancestors(
         name: Folder resource name
         raw_ancestors: Ancestor list from Asset API (may be incomplete)
         parent: Parent resource name
-        loaded_folders: Dict of already loaded folders (for traversal)
+        loaded_folders: Mapping of already loaded folders (for traversal)
         org_name: Organization resource name
 
     Returns:
@@ -257,13 +277,25 @@ def build_folder_ancestors(
         while current_parent and current_parent.startswith("folders/"):
             ancestors.append(current_parent)
 
-            # Check if this parent is already loaded
-            if current_parent in loaded_folders:
-                parent_folder = loaded_folders[current_parent]
-                # Add remaining ancestors from the parent (excluding duplicates)
-                for anc in parent_folder.ancestors:
-                    if anc != current_parent and anc not in ancestors:
-                        ancestors.append(anc)
+            # Check if this parent is already loaded; its chain is already
+            # complete, so reuse it instead of walking further up
+            parent_folder = loaded_folders.get(current_parent)
+            if parent_folder is not None:
+                parent_ancestors = parent_folder.ancestors
+                if (
+                    parent_ancestors
+                    and parent_ancestors[0] == current_parent
+                    and name not in parent_ancestors
+                ):
+                    # Well-formed [parent, ..., org] chain: splice it in whole
+                    ancestors.extend(parent_ancestors[1:])
+                else:
+                    # Add remaining ancestors from the parent (excluding duplicates)
+                    seen = set(ancestors)
+                    for anc in parent_ancestors:
+                        if anc not in seen:
+                            ancestors.append(anc)
+                            seen.add(anc)
                 break
             else:
                 # Parent not loaded yet, add org and break
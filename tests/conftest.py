@@ -0,0 +1,82 @@
+import pytest
+from google.cloud import resourcemanager_v3
+
+from gcpath.cache import _read_cache_file
+from gcpath.core import Hierarchy, OrganizationNode, Folder, Project
+from gcpath.loaders import clear_clients
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients():
+    """Ensure each test builds GCP clients from its own patched classes."""
+    clear_clients()
+    yield
+    clear_clients()
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache_reads():
+    """Ensure no test sees cache file contents parsed by another test."""
+    _read_cache_file.cache_clear()
+    yield
+    _read_cache_file.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory so no test touches ~/.gcpath."""
+    path = tmp_path / "cache.json"
+    monkeypatch.setattr("gcpath.cache.CACHE_DIR", tmp_path)
+    monkeypatch.setattr("gcpath.cache.CACHE_FILE", path)
+    return path
+
+
+# Protobuf message construction is slow, so the common org is built once.
+# Tests must not mutate it; build a local Organization for different values.
+@pytest.fixture(scope="session")
+def org_proto():
+    """Returns the shared organizations/123 (example.com) Organization proto."""
+    return resourcemanager_v3.Organization(
+        name="organizations/123", display_name="example.com"
+    )
+
+
+@pytest.fixture(scope="session")
+def large_hierarchy():
+    """Returns a synthetic Hierarchy of 5 orgs x 100 folders x 20 projects.
+
+    Built once per session; tests must treat it as read-only.
+    """
+    org_nodes = []
+    projects = []
+    for o in range(5):
+        org_name = f"organizations/{o}"
+        node = OrganizationNode(
+            organization=resourcemanager_v3.Organization(
+                name=org_name, display_name=f"org{o}.example.com"
+            )
+        )
+        org_nodes.append(node)
+        for f in range(100):
+            folder_name = f"folders/{o}{f:03d}"
+            folder = Folder(
+                name=folder_name,
+                display_name=f"folder-{f}",
+                ancestors=[folder_name, org_name],
+                parent=org_name,
+                organization=node,
+            )
+            node.folders[folder_name] = folder
+            for p in range(20):
+                project_id = f"project-{o}-{f}-{p}"
+                projects.append(
+                    Project(
+                        name=f"projects/{o}{f:03d}{p:02d}",
+                        project_id=project_id,
+                        display_name=project_id,
+                        parent=folder_name,
+                        organization=node,
+                        folder=folder,
+                    )
+                )
+    return Hierarchy(organizations=org_nodes, projects=projects)
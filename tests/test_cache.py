@@ -3,6 +3,8 @@ Tests for the cache module.
 """
 
 import json
+import os
+import time
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch
 from pathlib import Path
@@ -25,15 +27,14 @@ from gcpath.cache import (
 from gcpath.core import Hierarchy, OrganizationNode, Folder, Project
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
-SAMPLE_CACHE_FILE = FIXTURES_DIR / "sample_cache_v1.json"
+SAMPLE_CACHE_FILE = FIXTURES_DIR / "sample_cache_v2.json"
+LEGACY_CACHE_FILE = FIXTURES_DIR / "sample_cache_v1.json"
 
 
-@pytest.fixture
-def mock_hierarchy():
+# The cache functions only read the hierarchy, so it is built once per module
+@pytest.fixture(scope="module")
+def mock_hierarchy(org_proto):
     """Returns a mock Hierarchy object for testing."""
-    org_proto = resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
-    )
     org1 = OrganizationNode(organization=org_proto)
 
     folder1 = Folder(
@@ -67,20 +68,32 @@ def mock_hierarchy():
     return Hierarchy(organizations=[org1], projects=[project1, project2])
 
 
+def _fresh_cache_data():
+    return {
+        "version": CACHE_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "organizations": [],
+        "organizationless_projects": {},
+    }
+
+
 def test_hierarchy_to_dict(mock_hierarchy):
     """Test serialization of Hierarchy to dictionary."""
     hierarchy_dict = _hierarchy_to_dict(mock_hierarchy)
 
     assert hierarchy_dict["version"] == CACHE_VERSION
     assert "timestamp" in hierarchy_dict
+    assert isinstance(hierarchy_dict["timestamp_epoch"], float)
     assert len(hierarchy_dict["organizations"]) == 1
-    assert len(hierarchy_dict["organizationless_projects"]) == 1
+    assert hierarchy_dict["organizationless_projects"]["names"] == ["projects/000"]
+    assert hierarchy_dict["organizationless_projects"]["folder_names"] == [None]
 
     org_data = hierarchy_dict["organizations"][0]
     assert org_data["organization"]["name"] == "organizations/123"
-    assert len(org_data["folders"]) == 1
-    assert len(org_data["projects"]) == 1
-    assert org_data["projects"][0]["name"] == "projects/789"
+    assert org_data["folders"]["names"] == ["folders/456"]
+    assert org_data["folders"]["ancestors"] == [["folders/456", "organizations/123"]]
+    assert org_data["projects"]["names"] == ["projects/789"]
+    assert org_data["projects"]["folder_names"] == ["folders/456"]
 
 
 def test_dict_to_hierarchy(mock_hierarchy):
@@ -109,6 +122,38 @@ def test_dict_to_hierarchy(mock_hierarchy):
     assert p2.organization is None
 
 
+def test_dict_to_hierarchy_builds_slotted_objects(mock_hierarchy):
+    """Test that the rebuilt nodes carry no per-instance __dict__."""
+    hierarchy = _dict_to_hierarchy(_hierarchy_to_dict(mock_hierarchy))
+    assert hierarchy is not None
+    org = hierarchy.organizations[0]
+
+    for obj in (org, org.folders["folders/456"], *hierarchy.projects):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_dict_to_hierarchy_interns_shared_strings(mock_hierarchy):
+    """Test that repeated resource names share one string object after loading."""
+    # json.loads returns a distinct str object for every occurrence
+    data = json.loads(json.dumps(_hierarchy_to_dict(mock_hierarchy)))
+    org_data = data["organizations"][0]
+    org_data["projects"]["names"].append("projects/790")
+    org_data["projects"]["project_ids"].append("test-project-2")
+    org_data["projects"]["display_names"].append("Test Project 2")
+    org_data["projects"]["parents"].append("folders/456")
+    org_data["projects"]["folder_names"].append("folders/456")
+
+    hierarchy = _dict_to_hierarchy(data)
+    assert hierarchy is not None
+    p1, p2 = (p for p in hierarchy.projects if p.organization is not None)
+    folder = hierarchy.organizations[0].folders["folders/456"]
+
+    assert p1.parent is p2.parent
+    assert p1.parent is folder.name
+    assert folder.ancestors[0] is folder.name
+    assert folder.ancestors[1] is folder.parent
+
+
 def test_dict_to_hierarchy_version_mismatch():
     """Test that version mismatch returns None."""
     data = {"version": 9999, "organizations": []}
@@ -124,135 +169,169 @@ def test_load_from_fixture():
     assert hierarchy is not None
     assert len(hierarchy.organizations) == 1
     assert len(hierarchy.projects) == 2
+    project = next(p for p in hierarchy.projects if p.name == "projects/789")
+    assert project.folder is hierarchy.organizations[0].folders["folders/456"]
+
+
+def test_load_from_legacy_fixture():
+    """Test that a cache in the old per-resource layout is ignored."""
+    with open(LEGACY_CACHE_FILE, "r") as f:
+        data = json.load(f)
+
+    assert _dict_to_hierarchy(data) is None
 
 
-@patch("gcpath.cache.CACHE_FILE")
-def test_read_cache_not_found(mock_cache_file):
+def test_read_cache_not_found(cache_file):
     """Test read_cache when the cache file does not exist."""
-    mock_cache_file.exists.return_value = False
+    assert not cache_file.exists()
     assert read_cache() is None
 
 
-@patch("gcpath.cache.CACHE_FILE")
-@patch("builtins.open")
-@patch("json.load")
-def test_read_cache_success(mock_json_load, mock_open, mock_cache_file):
+def test_read_cache_success(cache_file):
     """Test successful reading of the cache with fresh timestamp."""
-    mock_cache_file.exists.return_value = True
-    # Return a minimal valid structure with fresh timestamp
-    mock_json_load.return_value = {
-        "version": CACHE_VERSION,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "organizations": [],
-        "organizationless_projects": [],
-    }
+    cache_file.write_text(json.dumps(_fresh_cache_data()))
 
     hierarchy = read_cache()
     assert isinstance(hierarchy, Hierarchy)
 
 
-@patch("gcpath.cache.CACHE_DIR")
-@patch("gcpath.cache.CACHE_FILE")
-@patch("builtins.open")
-@patch("json.dump")
-def test_write_cache(
-    mock_json_dump, mock_open, mock_cache_file, mock_cache_dir, mock_hierarchy
-):
+@pytest.mark.parametrize("dir_exists", [True, False])
+def test_write_cache(cache_file, mock_hierarchy, monkeypatch, dir_exists):
     """Test writing to the cache file."""
+    if not dir_exists:
+        cache_file = cache_file.parent / "missing" / "cache.json"
+        monkeypatch.setattr("gcpath.cache.CACHE_DIR", cache_file.parent)
+        monkeypatch.setattr("gcpath.cache.CACHE_FILE", cache_file)
+
     write_cache(mock_hierarchy)
-    mock_cache_dir.mkdir.assert_called_once_with(parents=True, exist_ok=True)
-    mock_open.assert_called_once_with(mock_cache_file, "w")
-    mock_json_dump.assert_called_once()
 
-    # Verify the structure passed to json.dump has version
-    args, _ = mock_json_dump.call_args
-    data = args[0]
+    data = json.loads(cache_file.read_text())
     assert data["version"] == CACHE_VERSION
 
+    # The written file reads back as the same hierarchy
+    hierarchy = read_cache()
+    assert hierarchy is not None
+    assert sorted(p.name for p in hierarchy.projects) == [
+        "projects/000",
+        "projects/789",
+    ]
 
-@patch("gcpath.cache.CACHE_FILE")
-def test_clear_cache_exists(mock_cache_file):
-    """Test clearing the cache when the file exists."""
-    mock_cache_file.exists.return_value = True
-    assert clear_cache() is True
-    mock_cache_file.unlink.assert_called_once()
 
+def test_write_cache_large_round_trip(large_hierarchy):
+    """Test that a realistically sized hierarchy survives a write and read."""
+    write_cache(large_hierarchy)
+    hierarchy = read_cache()
 
-def test_is_cache_fresh_within_ttl():
-    """Test that cache is fresh within TTL."""
-    data = {
-        "version": CACHE_VERSION,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
-    assert is_cache_fresh(data, DEFAULT_CACHE_TTL_HOURS) is True
+    assert hierarchy is not None
+    assert len(hierarchy.organizations) == 5
+    assert sum(len(o.folders) for o in hierarchy.organizations) == 500
+    assert len(hierarchy.projects) == 10_000
+    for project in hierarchy.projects:
+        assert project.folder is project.organization.folders[project.parent]
 
+    info = get_cache_info()
+    assert (info.org_count, info.folder_count, info.project_count) == (5, 500, 10_000)
 
-def test_is_cache_fresh_expired():
-    """Test that cache is stale when beyond TTL."""
-    old_time = datetime.now(timezone.utc) - timedelta(hours=80)
-    data = {
-        "version": CACHE_VERSION,
-        "timestamp": old_time.isoformat(),
-    }
-    assert is_cache_fresh(data, DEFAULT_CACHE_TTL_HOURS) is False
 
+def test_write_cache_atomic(cache_file, mock_hierarchy):
+    """Test that a failed write leaves the previous cache file untouched."""
+    cache_file.write_text('{"version": 0}')
+
+    with patch("gcpath.cache.os.replace", side_effect=OSError("disk full")):
+        write_cache(mock_hierarchy)
+
+    assert cache_file.read_text() == '{"version": 0}'
+    assert list(cache_file.parent.iterdir()) == [cache_file]
 
-def test_is_cache_fresh_no_timestamp():
-    """Test that cache without timestamp is not fresh."""
+
+def test_clear_cache_exists(cache_file):
+    """Test clearing the cache when the file exists."""
+    cache_file.write_text("{}")
+    assert clear_cache() is True
+    assert not cache_file.exists()
+
+
+@pytest.mark.parametrize(
+    "timestamp, expected",
+    [
+        pytest.param(datetime.now(timezone.utc).isoformat(), True, id="within_ttl"),
+        pytest.param(
+            (datetime.now(timezone.utc) - timedelta(hours=80)).isoformat(),
+            False,
+            id="expired",
+        ),
+        pytest.param(None, False, id="no_timestamp"),
+        pytest.param("invalid-timestamp", False, id="invalid_timestamp"),
+    ],
+)
+def test_is_cache_fresh(timestamp, expected):
+    """Test cache freshness against the ISO timestamp."""
     data = {"version": CACHE_VERSION}
-    assert is_cache_fresh(data) is False
+    if timestamp is not None:
+        data["timestamp"] = timestamp
+    assert is_cache_fresh(data, DEFAULT_CACHE_TTL_HOURS) is expected
 
 
-def test_is_cache_fresh_invalid_timestamp():
-    """Test that cache with invalid timestamp is not fresh."""
+def test_is_cache_fresh_epoch_timestamp():
+    """Test that the epoch timestamp is preferred over the ISO string."""
     data = {
         "version": CACHE_VERSION,
         "timestamp": "invalid-timestamp",
+        "timestamp_epoch": 1_000_000.0,
     }
-    assert is_cache_fresh(data) is False
+    with patch("gcpath.cache.time.time", return_value=1_000_000.0 + 3600):
+        assert is_cache_fresh(data, ttl_hours=2) is True
+        assert is_cache_fresh(data, ttl_hours=0.5) is False
+
 
+def test_read_cache_stale(cache_file):
+    """Test that a cache file older than the TTL is rejected without parsing."""
+    cache_file.write_text(json.dumps(_fresh_cache_data()))
+    old_mtime = time.time() - 80 * 3600
+    os.utime(cache_file, (old_mtime, old_mtime))
 
-@patch("gcpath.cache.CACHE_FILE")
-@patch("builtins.open")
-@patch("json.load")
-def test_read_cache_stale(mock_json_load, mock_open, mock_cache_file):
-    """Test that read_cache returns None for stale cache."""
-    mock_cache_file.exists.return_value = True
+    with patch("json.load") as mock_json_load:
+        assert read_cache() is None
+    mock_json_load.assert_not_called()
+
+
+def test_read_cache_stale_timestamp(cache_file):
+    """Test that read_cache returns None for a recent file with a stale timestamp."""
     old_time = datetime.now(timezone.utc) - timedelta(hours=80)
-    mock_json_load.return_value = {
-        "version": CACHE_VERSION,
-        "timestamp": old_time.isoformat(),
-        "organizations": [],
-        "organizationless_projects": [],
-    }
+    cache_file.write_text(
+        json.dumps({**_fresh_cache_data(), "timestamp": old_time.isoformat()})
+    )
 
     hierarchy = read_cache()
     assert hierarchy is None
 
 
-@patch("gcpath.cache.CACHE_FILE")
-@patch("builtins.open")
-@patch("json.load")
-def test_read_cache_raw_success(mock_json_load, mock_open, mock_cache_file):
+def test_read_cache_raw_success(cache_file):
     """Test successful reading of raw cache data."""
-    mock_cache_file.exists.return_value = True
-    test_data = {
-        "version": CACHE_VERSION,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "organizations": [],
-        "organizationless_projects": [],
-    }
-    mock_json_load.return_value = test_data
+    test_data = _fresh_cache_data()
+    cache_file.write_text(json.dumps(test_data))
 
     data = read_cache_raw()
     assert data == test_data
 
 
-@patch("gcpath.cache.CACHE_FILE")
-def test_get_cache_info_not_exists(mock_cache_file):
-    """Test get_cache_info when cache file does not exist."""
-    mock_cache_file.exists.return_value = False
+def test_read_cache_raw_reuses_unchanged_file(cache_file):
+    """Test that an unchanged cache file is parsed only once."""
+    cache_file.write_text(json.dumps({"version": CACHE_VERSION}))
+
+    with patch("json.load", wraps=json.load) as mock_json_load:
+        assert read_cache_raw() == {"version": CACHE_VERSION}
+        assert read_cache_raw() == {"version": CACHE_VERSION}
+        assert mock_json_load.call_count == 1
+
+        # A rewritten file is parsed again
+        cache_file.write_text(json.dumps({"version": CACHE_VERSION + 1}))
+        assert read_cache_raw() == {"version": CACHE_VERSION + 1}
+        assert mock_json_load.call_count == 2
 
+
+def test_get_cache_info_not_exists():
+    """Test get_cache_info when cache file does not exist."""
     info = get_cache_info()
     assert info.exists is False
     assert info.fresh is False
@@ -262,12 +341,8 @@ def test_get_cache_info_not_exists(mock_cache_file):
     assert info.org_count == 0
 
 
-@patch("gcpath.cache.CACHE_FILE")
-def test_get_cache_info_fresh(mock_cache_file):
+def test_get_cache_info_fresh(cache_file):
     """Test get_cache_info for fresh cache."""
-    mock_cache_file.exists.return_value = True
-    mock_cache_file.stat.return_value.st_size = 1024
-
     test_data = {
         "version": CACHE_VERSION,
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -275,58 +350,64 @@ def test_get_cache_info_fresh(mock_cache_file):
             {
                 "organization": {"name": "organizations/123", "display_name": "org1"},
                 "folders": {
-                    "folders/1": {
-                        "name": "folders/1",
-                        "display_name": "f1",
-                        "ancestors": ["folders/1", "organizations/123"],
-                        "parent": "organizations/123",
-                    }
+                    "names": ["folders/1"],
+                    "display_names": ["f1"],
+                    "ancestors": [["folders/1", "organizations/123"]],
+                    "parents": ["organizations/123"],
+                },
+                "projects": {
+                    "names": ["projects/p1"],
+                    "project_ids": ["p1"],
+                    "display_names": ["P1"],
+                    "parents": ["organizations/123"],
+                    "folder_names": [None],
                 },
-                "projects": [
-                    {
-                        "name": "projects/p1",
-                        "project_id": "p1",
-                        "display_name": "P1",
-                        "parent": "organizations/123",
-                        "folder_name": None,
-                    }
-                ],
             }
         ],
-        "organizationless_projects": [],
+        "organizationless_projects": {},
     }
+    cache_file.write_text(json.dumps(test_data))
 
-    with patch("gcpath.cache.read_cache_raw", return_value=test_data):
-        info = get_cache_info()
+    info = get_cache_info()
 
     assert info.exists is True
     assert info.fresh is True
     assert info.age_seconds is not None
-    assert info.size_bytes == 1024
+    assert info.size_bytes == cache_file.stat().st_size
     assert info.version == CACHE_VERSION
     assert info.org_count == 1
     assert info.folder_count == 1
     assert info.project_count == 1
 
 
-@patch("gcpath.cache.CACHE_FILE")
-def test_get_cache_info_stale(mock_cache_file):
-    """Test get_cache_info for stale cache."""
-    mock_cache_file.exists.return_value = True
-    mock_cache_file.stat.return_value.st_size = 512
+def test_get_cache_info_legacy_format(cache_file):
+    """Test get_cache_info still reports an old-format cache file."""
+    cache_file.write_text(LEGACY_CACHE_FILE.read_text())
+
+    info = get_cache_info()
+
+    assert info.exists is True
+    assert info.fresh is False
+    assert info.age_seconds is not None
+    assert info.size_bytes == cache_file.stat().st_size
+    assert info.version == 1
+    assert (info.org_count, info.folder_count, info.project_count) == (1, 1, 2)
+
 
+def test_get_cache_info_stale(cache_file):
+    """Test get_cache_info for stale cache."""
     old_time = datetime.now(timezone.utc) - timedelta(hours=80)
     test_data = {
         "version": CACHE_VERSION,
         "timestamp": old_time.isoformat(),
         "organizations": [],
-        "organizationless_projects": [],
+        "organizationless_projects": {},
     }
+    cache_file.write_text(json.dumps(test_data))
 
-    with patch("gcpath.cache.read_cache_raw", return_value=test_data):
-        info = get_cache_info()
+    info = get_cache_info()
 
     assert info.exists is True
     assert info.fresh is False
     assert info.age_seconds is not None
-    assert info.size_bytes == 512
+    assert info.size_bytes == cache_file.stat().st_size
@@ -4,7 +4,6 @@ from unittest.mock import patch, MagicMock
 from gcpath.cli import app
 from gcpath.core import Folder, OrganizationNode, Hierarchy, Project, GCPathError
 from gcpath.cache import CacheInfo
-from google.cloud import resourcemanager_v3
 
 runner = CliRunner()
 
@@ -16,11 +15,9 @@ def mock_read_cache():
         yield
 
 
-@pytest.fixture
-def mock_hierarchy():
-    org_proto = resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
-    )
+# Commands only read the hierarchy, so it is built once for the module
+@pytest.fixture(scope="module")
+def mock_hierarchy(org_proto):
     org_node = OrganizationNode(organization=org_proto)
 
     # F1 (depth 1)
@@ -66,9 +63,28 @@ def mock_hierarchy():
     return Hierarchy([org_node], [p1, orgless_p])
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_ls_command(mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+@pytest.fixture(autouse=True)
+def mock_load(mock_hierarchy):
+    """Serve mock_hierarchy from Hierarchy.load unless a test overrides it."""
+    with patch("gcpath.core.Hierarchy.load", return_value=mock_hierarchy) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_resolve():
+    """Keep Hierarchy.resolve_ancestry from building real GCP clients."""
+    with patch("gcpath.cli.Hierarchy.resolve_ancestry") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_confirm():
+    """Answer every confirmation prompt with yes unless a test overrides it."""
+    with patch("typer.confirm", return_value=True) as mock:
+        yield mock
+
+
+def test_ls_command():
     result = runner.invoke(app, ["ls"])
     assert result.exit_code == 0
     # Top level orgs and orgless projects by default
@@ -76,10 +92,18 @@ def test_ls_command(mock_load, mock_hierarchy):
     assert "//_/Standalone" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-@patch("gcpath.cli.Hierarchy.resolve_ancestry")
-def test_ls_positional_resource(mock_resolve, mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+@patch("gcpath.cli.write_cache")
+def test_ls_cache_hit_skips_load_and_write(mock_write_cache, mock_load, mock_hierarchy):
+    """A cached hierarchy is used as-is and not serialized back to disk."""
+    with patch("gcpath.cli.read_cache", return_value=mock_hierarchy):
+        result = runner.invoke(app, ["ls"])
+    assert result.exit_code == 0
+    assert "//example.com" in result.stdout
+    mock_load.assert_not_called()
+    mock_write_cache.assert_not_called()
+
+
+def test_ls_positional_resource(mock_resolve):
     mock_resolve.return_value = "//example.com/f1"
 
     # List folder/1 children
@@ -90,9 +114,7 @@ def test_ls_positional_resource(mock_resolve, mock_load, mock_hierarchy):
     assert "//example.com/f1/Project%201" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_ls_recursive(mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_ls_recursive():
     result = runner.invoke(app, ["ls", "-R"])
     assert result.exit_code == 0
     assert "//example.com" in result.stdout
@@ -101,9 +123,7 @@ def test_ls_recursive(mock_load, mock_hierarchy):
     assert "//example.com/f1/Project%201" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_ls_long_format(mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_ls_long_format():
     result = runner.invoke(app, ["ls", "-l"])
     assert result.exit_code == 0
     assert "Path" in result.stdout
@@ -112,38 +132,23 @@ def test_ls_long_format(mock_load, mock_hierarchy):
     assert "organizations/123" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_ls_long_format_shows_org_resource_names(mock_load, mock_hierarchy):
-    """Verify organization resource names appear in long format"""
-    mock_load.return_value = mock_hierarchy
-    result = runner.invoke(app, ["ls", "-l"])
-    assert result.exit_code == 0
-    assert "organizations/123" in result.stdout
-
-
-@patch("gcpath.core.Hierarchy.load")
-def test_ls_long_format_shows_folder_resource_names(mock_load, mock_hierarchy):
+def test_ls_long_format_shows_folder_resource_names(mock_resolve):
     """Verify folder resource names appear in long format"""
-    mock_load.return_value = mock_hierarchy
+    mock_resolve.return_value = "//example.com"
     result = runner.invoke(app, ["ls", "-l", "organizations/123"])
     assert result.exit_code == 0
     assert "folders/1" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_ls_long_format_shows_project_resource_names(mock_load, mock_hierarchy):
+def test_ls_long_format_shows_project_resource_names(mock_resolve):
     """Verify project resource names appear in long format"""
-    mock_load.return_value = mock_hierarchy
+    mock_resolve.return_value = "//example.com/f1"
     result = runner.invoke(app, ["ls", "-l", "folders/1"])
     assert result.exit_code == 0
     assert "projects/p1" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-@patch("typer.confirm")
-def test_tree_command_full(mock_confirm, mock_load, mock_hierarchy):
-    mock_confirm.return_value = True  # User confirms the prompt
-    mock_load.return_value = mock_hierarchy
+def test_tree_command_full():
     result = runner.invoke(app, ["tree"])
     assert result.exit_code == 0
     assert "example.com" in result.stdout
@@ -152,98 +157,67 @@ def test_tree_command_full(mock_confirm, mock_load, mock_hierarchy):
     assert "(organizationless)" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_tree_depth_limit(mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_tree_depth_limit():
     result = runner.invoke(app, ["tree", "-L", "1"])
     assert result.exit_code == 0
     assert "f1" in result.stdout
     assert "f11" not in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_tree_accepts_level_greater_than_3(mock_load, mock_hierarchy):
+def test_tree_accepts_level_greater_than_3():
     """Test that tree command accepts level > 3 (no more artificial limit)"""
-    mock_load.return_value = mock_hierarchy
     # Use -y to skip the prompt that would trigger for level >= 4
     result = runner.invoke(app, ["tree", "-L", "5", "-y"])
     assert result.exit_code == 0
 
 
 @patch("gcpath.cli.get_cache_info")
-@patch("gcpath.core.Hierarchy.load")
-@patch("typer.confirm")
-def test_tree_prompts_on_unlimited_load(
-    mock_confirm, mock_load, mock_cache_info, mock_hierarchy
-):
+def test_tree_prompts_on_unlimited_load(mock_cache_info, mock_confirm):
     """Test that tree prompts when loading full org tree without limit"""
     mock_cache_info.return_value = CacheInfo(
         exists=False, fresh=False, age_seconds=None, size_bytes=None,
         version=None, org_count=0, folder_count=0, project_count=0
     )
-    mock_confirm.return_value = True
-    mock_load.return_value = mock_hierarchy
     result = runner.invoke(app, ["tree"])
     assert mock_confirm.called
     assert result.exit_code == 0
 
 
 @patch("gcpath.cli.get_cache_info")
-@patch("gcpath.core.Hierarchy.load")
-@patch("typer.confirm")
-def test_tree_prompts_on_large_level(
-    mock_confirm, mock_load, mock_cache_info, mock_hierarchy
-):
+def test_tree_prompts_on_large_level(mock_cache_info, mock_confirm):
     """Test that tree prompts when level >= 4"""
     mock_cache_info.return_value = CacheInfo(
         exists=False, fresh=False, age_seconds=None, size_bytes=None,
         version=None, org_count=0, folder_count=0, project_count=0
     )
-    mock_confirm.return_value = True
-    mock_load.return_value = mock_hierarchy
     result = runner.invoke(app, ["tree", "-L", "4"])
     assert mock_confirm.called
     assert result.exit_code == 0
 
 
-@patch("gcpath.core.Hierarchy.load")
-@patch("typer.confirm")
-def test_tree_yes_flag_skips_prompt(mock_confirm, mock_load, mock_hierarchy):
+def test_tree_yes_flag_skips_prompt(mock_confirm):
     """Test that --yes skips prompt"""
-    mock_load.return_value = mock_hierarchy
     result = runner.invoke(app, ["tree", "-y"])
     assert not mock_confirm.called
     assert result.exit_code == 0
 
 
-@patch("gcpath.core.Hierarchy.load")
-@patch("gcpath.cli.Hierarchy.resolve_ancestry")
-@patch("typer.confirm")
-def test_tree_scoped_load_no_prompt(
-    mock_confirm, mock_resolve, mock_load, mock_hierarchy
-):
+def test_tree_scoped_load_no_prompt(mock_confirm, mock_resolve):
     """Test that scoped loads don't prompt"""
-    mock_load.return_value = mock_hierarchy
     mock_resolve.return_value = "//example.com/f1"
     result = runner.invoke(app, ["tree", "folders/1"])
     assert not mock_confirm.called
     assert result.exit_code == 0
 
 
-@patch("gcpath.core.Hierarchy.load")
-@patch("typer.confirm")
-def test_tree_user_declines_prompt(mock_confirm, mock_load, mock_hierarchy):
+def test_tree_user_declines_prompt(mock_confirm):
     """Test that declining prompt exits cleanly"""
     mock_confirm.return_value = False
-    mock_load.return_value = mock_hierarchy
     result = runner.invoke(app, ["tree"])
     assert result.exit_code == 0  # Clean exit
 
 
-@patch("gcpath.core.Hierarchy.load")
-@patch("gcpath.cli.Hierarchy.resolve_ancestry")
-def test_tree_positional_resource(mock_resolve, mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_tree_positional_resource(mock_resolve):
     mock_resolve.return_value = "//example.com/f1"
     result = runner.invoke(app, ["tree", "folders/1"])
     assert result.exit_code == 0
@@ -251,24 +225,19 @@ def test_tree_positional_resource(mock_resolve, mock_load, mock_hierarchy):
     assert "f11" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_name_command(mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_name_command():
     result = runner.invoke(app, ["name", "//example.com/f1"])
     assert result.exit_code == 0
     assert "folders/1" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_name_command_id_only(mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_name_command_id_only():
     result = runner.invoke(app, ["name", "--id", "//example.com/f1"])
     assert result.exit_code == 0
     assert "1" in result.stdout
     assert "folders" not in result.stdout
 
 
-@patch("gcpath.cli.Hierarchy.resolve_ancestry")
 def test_path_command(mock_resolve):
     mock_resolve.return_value = "//example.com/f1"
     result = runner.invoke(app, ["path", "folders/1"])
@@ -276,17 +245,13 @@ def test_path_command(mock_resolve):
     assert "//example.com/f1" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_ls_no_resources_message(mock_load):
+@patch("google.auth.default", side_effect=Exception("no credentials"))
+def test_ls_no_resources_message(mock_auth_default, mock_load):
     h = Hierarchy([], [])
     mock_load.return_value = h
     result = runner.invoke(app, ["ls"])
     assert result.exit_code == 0
-    # No organizations or projects message check
-    # Depending on implementation it might print something or just empty list now with organizations/projects structure
-    # My current implementation of ls doesn't have the specific "No resources found" msg anymore, it just prints what it finds.
-    # But let's verify it doesn't crash.
-    pass
+    assert "No organizations or projects found" in result.stdout
 
 
 def test_handle_error_gcpath_error():
@@ -297,14 +262,11 @@ def test_handle_error_gcpath_error():
         handle_error(GCPathError("test error"))
 
 
-@patch("gcpath.cli.Hierarchy.load")
-def test_debug_flag(mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_debug_flag():
     result = runner.invoke(app, ["--debug", "ls"])
     assert result.exit_code == 0
 
 
-@patch("gcpath.core.Hierarchy.load")
 def test_ls_gmail_account(mock_load):
     # Mock google.auth.default to return a gmail account
     mock_creds = MagicMock()
@@ -320,10 +282,7 @@ def test_ls_gmail_account(mock_load):
         assert "user@gmail.com" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-@patch("gcpath.cli.Hierarchy.resolve_ancestry")
-def test_ls_recursive_folder(mock_resolve, mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_ls_recursive_folder(mock_resolve):
     mock_resolve.return_value = "//example.com/f1"
 
     result = runner.invoke(app, ["ls", "-R", "folders/1"])
@@ -350,18 +309,13 @@ def test_handle_error_service_unavailable():
         handle_error(gcp_exceptions.ServiceUnavailable("unavailable"))
 
 
-@patch("gcpath.core.Hierarchy.load")
-@patch("typer.confirm")
-def test_tree_with_ids(mock_confirm, mock_load, mock_hierarchy):
-    mock_confirm.return_value = True  # User confirms the prompt
-    mock_load.return_value = mock_hierarchy
+def test_tree_with_ids():
     result = runner.invoke(app, ["tree", "--ids"])
     assert result.exit_code == 0
     assert "(organizations/123)" in result.stdout
     assert "(folders/1)" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
 def test_name_organizationless_project(mock_load):
     # Setup hierarchy with an orgless project
     p1 = Project(
@@ -379,16 +333,13 @@ def test_name_organizationless_project(mock_load):
     assert "projects/965192208715" in result.stdout
 
 
-@patch("gcpath.core.Hierarchy.load")
-def test_name_multiple_paths(mock_load, mock_hierarchy):
-    mock_load.return_value = mock_hierarchy
+def test_name_multiple_paths():
     result = runner.invoke(app, ["name", "//example.com", "//example.com/f1"])
     assert result.exit_code == 0
     assert "organizations/123" in result.stdout
     assert "folders/1" in result.stdout
 
 
-@patch("gcpath.cli.Hierarchy.resolve_ancestry")
 def test_path_multiple_resources(mock_resolve):
     mock_resolve.side_effect = ["//path1", "//path2"]
     result = runner.invoke(app, ["path", "folders/1", "folders/2"])
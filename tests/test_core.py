@@ -1,3 +1,5 @@
+import logging
+
 import pytest
 from unittest.mock import patch, MagicMock
 from google.api_core import exceptions
@@ -6,16 +8,14 @@ from gcpath.core import (
     OrganizationNode,
     Hierarchy,
     Project,
+    PathParsingError,
     ResourceNotFoundError,
 )
 from google.cloud import resourcemanager_v3
 
 
-def test_folder_path_simple():
+def test_folder_path_simple(org_proto):
     # Setup
-    org_proto = resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
-    )
     org_node = OrganizationNode(organization=org_proto)
 
     # Hierarchy: Org -> F1 -> F2
@@ -40,11 +40,31 @@ def test_folder_path_simple():
     assert f2.path == "//example.com/f1/f2"
 
 
-def test_folder_is_path_match():
+def test_folder_path_is_cached():
     org_proto = resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
+        name="organizations/123", display_name="example org"
     )
     org_node = OrganizationNode(organization=org_proto)
+    f1 = Folder(
+        name="folders/1",
+        display_name="f 1",
+        ancestors=["folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    org_node.folders["folders/1"] = f1
+
+    assert org_node.escaped_display_name == "example%20org"
+    assert org_node.path == "//example%20org"
+    path = f1.path
+    assert path == "//example%20org/f%201"
+    # Subsequent reads reuse the computed string
+    assert f1.path is path
+    # Slotted dataclasses keep the cache without a per-instance __dict__
+    assert not hasattr(f1, "__dict__")
+
+
+def test_folder_is_path_match(org_proto):
+    org_node = OrganizationNode(organization=org_proto)
 
     # Hierarchy: Org -> F1 -> F2
     f1 = Folder(
@@ -72,11 +92,111 @@ def test_folder_is_path_match():
     assert f2.is_path_match(["f1"]) is False  # path too short
     assert f2.is_path_match(["f1", "f3"]) is False  # mismatch name
 
+    assert f2.parts == ("f1", "f2")
 
-def test_get_resource_name():
-    org_proto = resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
+
+def test_folder_is_path_match_missing_ancestor(org_proto):
+    org_node = OrganizationNode(organization=org_proto)
+
+    # folders/1 is never loaded, so folders/2 cannot be matched by path
+    f2 = Folder(
+        name="folders/2",
+        display_name="f2",
+        ancestors=["folders/2", "folders/1", "organizations/123"],
+        organization=org_node,
     )
+    org_node.folders["folders/2"] = f2
+
+    assert f2.parts == ("f2",)
+    assert f2.is_path_match(["f2"]) is False
+    assert f2.is_path_match(["f1", "f2"]) is False
+
+
+def test_folder_incomplete_path_warns_once(org_proto, caplog):
+    org_node = OrganizationNode(organization=org_proto)
+    f2 = Folder(
+        name="folders/2",
+        display_name="f2",
+        ancestors=["folders/2", "folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    org_node.folders["folders/2"] = f2
+
+    # Building the path index does not warn about the missing ancestor
+    with caplog.at_level(logging.WARNING, logger="gcpath.core"):
+        with pytest.raises(ResourceNotFoundError):
+            org_node.get_resource_name("/f1/f2")
+    assert not caplog.records
+
+    with caplog.at_level(logging.WARNING, logger="gcpath.core"):
+        assert f2.path == "//example.com/f2"
+        assert f2.path == "//example.com/f2"
+    assert [r.getMessage() for r in caplog.records] == [
+        "Path of folders/2 is incomplete: an ancestor was not loaded"
+    ]
+
+
+def test_folder_path_not_cached_until_ancestry_loaded(org_proto):
+    org_node = OrganizationNode(organization=org_proto)
+    f2 = Folder(
+        name="folders/2",
+        display_name="f2",
+        ancestors=["folders/2", "folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    org_node.folders["folders/2"] = f2
+    assert f2.path == "//example.com/f2"
+
+    # The missing ancestor is loaded later, e.g. by a scope folder load
+    org_node.folders["folders/1"] = Folder(
+        name="folders/1",
+        display_name="f1",
+        ancestors=["folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    assert f2.path == "//example.com/f1/f2"
+    assert f2.path is f2.path
+
+    # Changed ancestors take effect once the cache is reset
+    f2.ancestors = ["folders/2", "organizations/123"]
+    f2.reset_path()
+    assert f2.path == "//example.com/f2"
+
+
+def test_project_path_follows_folder_path(org_proto):
+    org_node = OrganizationNode(organization=org_proto)
+    f2 = Folder(
+        name="folders/2",
+        display_name="f2",
+        ancestors=["folders/2", "folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    org_node.folders["folders/2"] = f2
+    p1 = Project(
+        name="projects/p1",
+        project_id="p1",
+        display_name="p1",
+        parent="folders/2",
+        organization=org_node,
+        folder=f2,
+    )
+    assert p1.path == "//example.com/f2/p1"
+
+    org_node.folders["folders/1"] = Folder(
+        name="folders/1",
+        display_name="f1",
+        ancestors=["folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    assert p1.path == "//example.com/f1/f2/p1"
+    assert p1.path is p1.path
+
+    f2.ancestors = ["folders/2", "organizations/123"]
+    f2.reset_path()
+    assert p1.path == "//example.com/f2/p1"
+
+
+def test_get_resource_name(org_proto):
     org_node = OrganizationNode(organization=org_proto)
 
     f1 = Folder(
@@ -94,10 +214,7 @@ def test_get_resource_name():
         org_node.get_resource_name("/f2")
 
 
-def test_hierarchy_get_resource_name_full_path():
-    org_proto = resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
-    )
+def test_hierarchy_get_resource_name_full_path(org_proto):
     org_node = OrganizationNode(organization=org_proto)
     f1 = Folder(
         name="folders/1",
@@ -113,10 +230,84 @@ def test_hierarchy_get_resource_name_full_path():
     assert h.get_resource_name("//example.com") == "organizations/123"
 
 
-def test_hierarchy_get_path_by_resource_name():
-    org_proto = resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
+def test_hierarchy_get_resource_name_project_path(org_proto):
+    org_node = OrganizationNode(organization=org_proto)
+    f1 = Folder(
+        name="folders/1",
+        display_name="f1",
+        ancestors=["folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    org_node.folders["folders/1"] = f1
+    p1 = Project(
+        name="projects/p1",
+        project_id="p1",
+        display_name="Project 1",
+        parent="folders/1",
+        organization=org_node,
+        folder=f1,
+    )
+    orgless = Project(
+        name="projects/p2",
+        project_id="p2",
+        display_name="Project 2",
+        parent="organizations/0",
+        organization=None,
+        folder=None,
+    )
+
+    h = Hierarchy([org_node], [p1, orgless])
+
+    assert h.get_resource_name("//example.com/f1/Project%201") == "projects/p1"
+    assert h.get_resource_name("//_/Project%202") == "projects/p2"
+    with pytest.raises(ResourceNotFoundError):
+        h.get_resource_name("//example.com/f1/Project%202")
+    with pytest.raises(ResourceNotFoundError):
+        h.get_resource_name("//_/Project%201")
+
+
+def test_hierarchy_project_path_index_follows_folder_changes(org_proto):
+    org_node = OrganizationNode(organization=org_proto)
+    f2 = Folder(
+        name="folders/2",
+        display_name="f2",
+        ancestors=["folders/2", "folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    org_node.folders["folders/2"] = f2
+    p1 = Project(
+        name="projects/p1",
+        project_id="p1",
+        display_name="p1",
+        parent="folders/2",
+        organization=org_node,
+        folder=f2,
     )
+    h = Hierarchy([org_node], [p1])
+
+    # folders/1 is missing, so the project path is not final yet
+    with pytest.raises(ResourceNotFoundError):
+        h.get_resource_name("//example.com/f1/f2/p1")
+
+    org_node.folders["folders/1"] = Folder(
+        name="folders/1",
+        display_name="f1",
+        ancestors=["folders/1", "organizations/123"],
+        organization=org_node,
+    )
+    org_node.reset_path_index()
+    assert h.get_resource_name("//example.com/f1/f2/p1") == "projects/p1"
+
+    # Moving the folder up takes effect once the path lookups are reset
+    f2.ancestors = ["folders/2", "organizations/123"]
+    f2.reset_path()
+    h.reset_path_index()
+    assert h.get_resource_name("//example.com/f2/p1") == "projects/p1"
+    with pytest.raises(ResourceNotFoundError):
+        h.get_resource_name("//example.com/f1/f2/p1")
+
+
+def test_hierarchy_get_path_by_resource_name(org_proto):
     org_node = OrganizationNode(organization=org_proto)
     f1 = Folder(
         name="folders/1",
@@ -141,6 +332,11 @@ def test_hierarchy_get_path_by_resource_name():
     assert h.get_path_by_resource_name("organizations/123") == "//example.com"
     assert h.get_path_by_resource_name("projects/p1") == "//example.com/f1/Project%201"
 
+    # Repeated lookups are served from the per-instance memo
+    with patch.object(h, "_lookup_path_by_resource_name") as mock_lookup:
+        assert h.get_path_by_resource_name("folders/1") == "//example.com/f1"
+    mock_lookup.assert_not_called()
+
 
 def test_organizationless_project_path():
     p1 = Project(
@@ -152,12 +348,14 @@ def test_organizationless_project_path():
         folder=None,
     )
     assert p1.path == "//_/Project%201"
+    # Subsequent reads reuse the computed string
+    assert p1.path is p1.path
 
     h = Hierarchy([], [p1])
     assert h.get_resource_name("//_/Project%201") == "projects/p1"
 
 
-@patch("gcpath.core.resourcemanager_v3")
+@patch("gcpath.loaders.resourcemanager_v3")
 def test_resolve_ancestry_project(mock_rm):
     # Setup Mocks
     # Access classes from the mocked module
@@ -196,7 +394,7 @@ def test_resolve_ancestry_project(mock_rm):
     o_client.get_organization.assert_called_with(name="organizations/123")
 
 
-@patch("gcpath.core.resourcemanager_v3")
+@patch("gcpath.loaders.resourcemanager_v3")
 def test_resolve_ancestry_organization(mock_rm):
     o_client = mock_rm.OrganizationsClient.return_value
     mock_org = MagicMock()
@@ -207,7 +405,7 @@ def test_resolve_ancestry_organization(mock_rm):
     assert path == "//Example%20Org"
 
 
-@patch("gcpath.core.resourcemanager_v3")
+@patch("gcpath.loaders.resourcemanager_v3")
 def test_resolve_ancestry_not_found(mock_rm):
     p_client = mock_rm.ProjectsClient.return_value
     p_client.get_project.side_effect = exceptions.NotFound("Project not found")
@@ -216,7 +414,7 @@ def test_resolve_ancestry_not_found(mock_rm):
         Hierarchy.resolve_ancestry("projects/nonexistent")
 
 
-@patch("gcpath.core.resourcemanager_v3")
+@patch("gcpath.loaders.resourcemanager_v3")
 def test_resolve_ancestry_permission_denied(mock_rm):
     p_client = mock_rm.ProjectsClient.return_value
     p_client.get_project.side_effect = exceptions.PermissionDenied("Access denied")
@@ -225,7 +423,7 @@ def test_resolve_ancestry_permission_denied(mock_rm):
         Hierarchy.resolve_ancestry("projects/restricted")
 
 
-@patch("gcpath.core.resourcemanager_v3")
+@patch("gcpath.loaders.resourcemanager_v3")
 def test_resolve_ancestry_organizationless(mock_rm):
     p_client = mock_rm.ProjectsClient.return_value
 
@@ -242,9 +440,8 @@ def test_resolve_ancestry_organizationless(mock_rm):
 @patch("gcpath.loaders.resourcemanager_v3")
 @patch("gcpath.core.resourcemanager_v3")
 def test_hierarchy_load_rm(mock_core_rm, mock_loaders_rm):
-    # Use the same mock for both core and loaders
-    mock_rm = mock_core_rm
-    mock_loaders_rm.FoldersClient = mock_rm.FoldersClient
+    # All clients are created in loaders; core only builds request objects
+    mock_rm = mock_loaders_rm
 
     # Mock Org
     org_client = mock_rm.OrganizationsClient.return_value
@@ -275,7 +472,7 @@ def test_hierarchy_load_rm(mock_core_rm, mock_loaders_rm):
     assert h.projects[0].folder.name == "folders/1"
 
 
-@patch("gcpath.core.resourcemanager_v3")
+@patch("gcpath.loaders.resourcemanager_v3")
 def test_hierarchy_load_permission_denied(mock_rm):
     org_client = mock_rm.OrganizationsClient.return_value
     org_client.search_organizations.side_effect = exceptions.PermissionDenied("denied")
@@ -284,6 +481,33 @@ def test_hierarchy_load_permission_denied(mock_rm):
     assert len(h.organizations) == 0
 
 
+def test_load_organizations_keeps_orgs_loaded_before_failure():
+    orgs = [
+        resourcemanager_v3.Organization(name=f"organizations/{i}", display_name=f"o{i}")
+        for i in range(1, 4)
+    ]
+    org_client = MagicMock()
+    org_client.search_organizations.return_value = orgs
+
+    def load_org_asset(node, scope_resource, recursive):
+        if node.organization.name == "organizations/2":
+            raise RuntimeError("boom")
+        return [node.organization.name]
+
+    with patch.object(Hierarchy, "_load_org_asset", side_effect=load_org_asset):
+        org_nodes, org_projects = Hierarchy._load_organizations(
+            org_client, None, False, None, False
+        )
+
+    # As with a sequential load: org 1 is kept with its projects, the failing
+    # org 2 is kept, and org 3 after it is dropped
+    assert [o.organization.name for o in org_nodes] == [
+        "organizations/1",
+        "organizations/2",
+    ]
+    assert org_projects == ["organizations/1"]
+
+
 def test_path_parsing_errors():
     from gcpath.core import GCPathError
 
@@ -313,12 +537,14 @@ def test_organization_node_get_resource_name_multiple_matches():
         name="organizations/123", display_name="org"
     )
     node = OrganizationNode(organization=org_proto)
-    # This is hard to trigger with current is_path_match but let's try if possible or just mock
-    f1 = MagicMock(spec=Folder)
-    f1.is_path_match.return_value = True
-    f2 = MagicMock(spec=Folder)
-    f2.is_path_match.return_value = True
-    node.folders = {"f1": f1, "f2": f2}
+    # Two sibling folders sharing a display name resolve to the same path
+    for name in ("folders/1", "folders/2"):
+        node.folders[name] = Folder(
+            name=name,
+            display_name="path",
+            ancestors=[name, "organizations/123"],
+            organization=node,
+        )
     with pytest.raises(ResourceNotFoundError, match="Multiple folders found"):
         node.get_resource_name("/path")
 
@@ -337,16 +563,24 @@ def test_hierarchy_get_path_errors():
         h.get_path_by_resource_name("invalid/123")
 
 
+@patch("gcpath.loaders.resourcemanager_v3")
+def test_hierarchy_load_asset_api_rejects_invalid_scope(mock_rm):
+    with pytest.raises(PathParsingError, match="folders/1' OR '1'='1"):
+        Hierarchy.load(
+            via_resource_manager=False, scope_resource="folders/1' OR '1'='1"
+        )
+    mock_rm.OrganizationsClient.return_value.search_organizations.assert_not_called()
+
+
 @patch("gcpath.loaders.resourcemanager_v3")
 @patch("gcpath.loaders.asset_v1")
 @patch("gcpath.core.resourcemanager_v3")
 def test_hierarchy_load_asset_api(
     mock_core_rm, mock_loaders_asset, mock_loaders_rm
 ):
-    # Use the same mocks for both core and loaders
+    # All clients are created in loaders; core only builds request objects
     mock_asset = mock_loaders_asset
-    mock_rm = mock_core_rm
-    mock_loaders_rm.ProjectsClient = mock_rm.ProjectsClient
+    mock_rm = mock_loaders_rm
 
     # Mock Org
     org_client = mock_rm.OrganizationsClient.return_value
@@ -372,6 +606,7 @@ def test_hierarchy_load_asset_api(
     # Let's use a simpler approach for the mock to avoid dict(row) failure
     mock_resp = MagicMock()
     mock_resp.query_result.rows = [row_data]
+    mock_resp.query_result.next_page_token = ""
     asset_client.query_assets.return_value = mock_resp
 
     # Mock search_projects to return empty for organizationless projects
@@ -10,20 +10,14 @@ from gcpath.formatters import (
     sort_resources,
     format_tree_label,
     build_tree_view,
+    build_folders_by_parent,
+    build_projects_by_parent,
 )
-from google.cloud import resourcemanager_v3
 
 
 @pytest.fixture
-def mock_org():
-    return resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
-    )
-
-
-@pytest.fixture
-def mock_org_node(mock_org):
-    return OrganizationNode(organization=mock_org)
+def mock_org_node(org_proto):
+    return OrganizationNode(organization=org_proto)
 
 
 @pytest.fixture
@@ -58,6 +52,7 @@ def mock_hierarchy(mock_org_node, mock_folder, mock_project):
     hierarchy.organizations = [mock_org_node]
     hierarchy.folders = [mock_folder]
     hierarchy.projects = [mock_project]
+    hierarchy.organizationless_projects = []
 
     return hierarchy
 
@@ -107,6 +102,7 @@ def test_filter_direct_children_organizationless(mock_org_node):
         folder=None,
     )
     hierarchy.projects = [orgless_project]
+    hierarchy.organizationless_projects = [orgless_project]
 
     folders, projects = filter_direct_children(hierarchy, None)
 
@@ -114,6 +110,16 @@ def test_filter_direct_children_organizationless(mock_org_node):
     assert projects[0].name == "projects/orgless"
 
 
+# Test parent indexes
+def test_build_parent_indexes(mock_hierarchy, mock_folder, mock_project):
+    """Test indexing folders and projects by parent resource name."""
+    folders_by_parent = build_folders_by_parent(mock_hierarchy)
+    assert folders_by_parent == {"organizations/123": [mock_folder]}
+
+    projects_by_parent = build_projects_by_parent(mock_hierarchy)
+    assert projects_by_parent == {"folders/456": [mock_project]}
+
+
 # Test get_display_path
 def test_get_display_path_org(mock_org_node):
     """Test display path for organization."""
@@ -297,3 +303,46 @@ def test_build_tree_view_with_level_limit(mock_org_node, mock_hierarchy):
 
     # With level=0, no children should be added
     assert len(root.children) == 0
+
+
+def test_build_tree_view_nested_order_and_level(mock_org_node, mock_hierarchy):
+    """Test that nested folders keep order and respect the depth limit."""
+    from rich.tree import Tree
+
+    parent = Folder(
+        name="folders/1",
+        display_name="a",
+        ancestors=["folders/1", "organizations/123"],
+        organization=mock_org_node,
+        parent="organizations/123",
+    )
+    sibling = Folder(
+        name="folders/2",
+        display_name="b",
+        ancestors=["folders/2", "organizations/123"],
+        organization=mock_org_node,
+        parent="organizations/123",
+    )
+    child = Folder(
+        name="folders/3",
+        display_name="c",
+        ancestors=["folders/3", "folders/1", "organizations/123"],
+        organization=mock_org_node,
+        parent="folders/1",
+    )
+    mock_org_node.folders = {f.name: f for f in (sibling, child, parent)}
+
+    root = Tree("Test")
+    build_tree_view(root, mock_org_node, mock_hierarchy, {}, level=None)
+    assert [str(n.label) for n in root.children] == [
+        "[bold blue]a[/bold blue]",
+        "[bold blue]b[/bold blue]",
+    ]
+    assert [str(n.label) for n in root.children[0].children] == [
+        "[bold blue]c[/bold blue]"
+    ]
+
+    root = Tree("Test")
+    build_tree_view(root, mock_org_node, mock_hierarchy, {}, level=1)
+    assert len(root.children) == 2
+    assert root.children[0].children == []
@@ -4,25 +4,43 @@ import pytest
 from unittest.mock import MagicMock, patch
 from gcpath.core import OrganizationNode, Folder
 from gcpath.loaders import (
+    ASSET_QUERY_MAX_WAIT_SECONDS,
+    ASSET_QUERY_PAGE_SIZE,
+    ASSET_QUERY_POLL_MAX_DELAY,
+    ASSET_QUERY_TIMEOUT,
+    _iter_query_rows,
     build_folder_sql_query,
     build_project_sql_query,
+    fetch_project_rows_asset,
+    fix_folder_ancestors,
+    load_folders_rm,
     load_folders_asset,
     load_projects_asset,
+    load_scope_folder,
     load_organizationless_projects,
 )
-from google.cloud import resourcemanager_v3
+from google.api_core import exceptions
+from google.cloud import asset_v1, resourcemanager_v3
 
 
 @pytest.fixture
-def mock_org():
-    return resourcemanager_v3.Organization(
-        name="organizations/123", display_name="example.com"
-    )
+def mock_org_node(org_proto):
+    return OrganizationNode(organization=org_proto)
 
 
 @pytest.fixture
-def mock_org_node(mock_org):
-    return OrganizationNode(organization=mock_org)
+def fake_clock():
+    """Replace the loaders' clock so polling sleeps advance time instantly."""
+    clock = MagicMock()
+    clock.now = 0.0
+    clock.monotonic.side_effect = lambda: clock.now
+
+    def sleep(seconds):
+        clock.now += seconds
+
+    clock.sleep.side_effect = sleep
+    with patch("gcpath.loaders.time", clock):
+        yield clock
 
 
 # Test SQL query builders
@@ -71,6 +89,242 @@ def test_build_project_sql_query_with_ancestors_filter():
     assert "'folders/456' IN UNNEST(ancestors)" in query
 
 
+def test_build_sql_query_rejects_quotes():
+    """Test that filters which could break out of the SQL literal are rejected."""
+    with pytest.raises(ValueError):
+        build_folder_sql_query(parent_filter="folders/1' OR '1'='1")
+    with pytest.raises(ValueError):
+        build_project_sql_query(ancestors_filter="folders/1'")
+
+
+# Test load_folders_rm
+@patch("google.cloud.resourcemanager_v3.FoldersClient")
+def test_load_folders_rm(mock_folders_cls, mock_org_node):
+    """Test walking the folder tree via Resource Manager list_folders()."""
+    children = {
+        "organizations/123": [
+            resourcemanager_v3.Folder(name="folders/1", display_name="f1"),
+            resourcemanager_v3.Folder(name="folders/2", display_name="f2"),
+        ],
+        "folders/1": [
+            resourcemanager_v3.Folder(name="folders/11", display_name="f11"),
+        ],
+    }
+
+    def list_folders(request):
+        if request.parent == "folders/2":
+            raise exceptions.PermissionDenied("denied")
+        return children.get(request.parent, [])
+
+    mock_folders_cls.return_value.list_folders.side_effect = list_folders
+
+    load_folders_rm(mock_org_node, "organizations/123")
+
+    assert set(mock_org_node.folders) == {"folders/1", "folders/2", "folders/11"}
+    f11 = mock_org_node.folders["folders/11"]
+    assert f11.parent == "folders/1"
+    assert f11.ancestors == ["folders/11", "folders/1", "organizations/123"]
+    assert mock_org_node.folders["folders/2"].parent == "organizations/123"
+
+
+# Test fix_folder_ancestors
+def test_fix_folder_ancestors(mock_org_node):
+    """Test rebuilding ancestor chains from parent links."""
+
+    def add(name, parent):
+        mock_org_node.folders[name] = Folder(
+            name=name,
+            display_name=name,
+            ancestors=[],
+            organization=mock_org_node,
+            parent=parent,
+        )
+
+    add("folders/3", "folders/2")
+    add("folders/2", "folders/1")
+    add("folders/1", "organizations/123")
+    add("folders/4", "folders/2")
+    add("folders/9", "folders/404")  # parent not loaded
+
+    fix_folder_ancestors(mock_org_node)
+
+    folders = mock_org_node.folders
+    assert folders["folders/3"].ancestors == [
+        "folders/3",
+        "folders/2",
+        "folders/1",
+        "organizations/123",
+    ]
+    assert folders["folders/4"].ancestors == [
+        "folders/4",
+        "folders/2",
+        "folders/1",
+        "organizations/123",
+    ]
+    assert folders["folders/9"].ancestors == [
+        "folders/9",
+        "folders/404",
+        "organizations/123",
+    ]
+    # Folders directly under the org are left untouched
+    assert folders["folders/1"].ancestors == []
+
+
+def test_fix_folder_ancestors_keeps_complete_chain(mock_org_node):
+    """Test that an already complete chain is left as the same list."""
+    complete = ["folders/2", "folders/1", "organizations/123"]
+    for name, parent, ancestors in (
+        ("folders/1", "organizations/123", ["folders/1", "organizations/123"]),
+        ("folders/2", "folders/1", complete),
+    ):
+        mock_org_node.folders[name] = Folder(
+            name=name,
+            display_name=name,
+            ancestors=ancestors,
+            organization=mock_org_node,
+            parent=parent,
+        )
+
+    fix_folder_ancestors(mock_org_node)
+
+    assert mock_org_node.folders["folders/2"].ancestors is complete
+
+
+def test_fix_folder_ancestors_resets_cached_path(mock_org_node):
+    """Test that a path cached before the fix reflects the rebuilt chain."""
+    for name, display_name, parent in (
+        ("folders/1", "f1", "organizations/123"),
+        ("folders/2", "f2", "folders/1"),
+    ):
+        mock_org_node.folders[name] = Folder(
+            name=name,
+            display_name=display_name,
+            ancestors=[name, "organizations/123"],
+            organization=mock_org_node,
+            parent=parent,
+        )
+    f2 = mock_org_node.folders["folders/2"]
+    assert f2.path == "//example.com/f2"
+
+    fix_folder_ancestors(mock_org_node)
+
+    assert f2.path == "//example.com/f1/f2"
+
+
+# Test load_scope_folder
+@patch("google.cloud.resourcemanager_v3.FoldersClient")
+@patch("google.cloud.asset_v1.AssetServiceClient")
+def test_load_scope_folder_asset(
+    mock_asset_client_cls, mock_folders_cls, mock_org_node
+):
+    """Test that one Asset query yields the scope folder with its ancestry."""
+    mock_response = MagicMock()
+    mock_response.query_result.rows = [
+        {
+            "f": [
+                {"v": "//cloudresourcemanager.googleapis.com/folders/11"},
+                {"v": "f11"},
+                {"v": "folders/1"},
+                {
+                    "v": [
+                        {"v": "folders/11"},
+                        {"v": "folders/1"},
+                        {"v": "organizations/123"},
+                    ]
+                },
+            ]
+        }
+    ]
+    mock_response.query_result.next_page_token = ""
+    mock_asset_client_cls.return_value.query_assets.return_value = mock_response
+
+    load_scope_folder(mock_org_node, "folders/11")
+
+    folder = mock_org_node.folders["folders/11"]
+    assert folder.parent == "folders/1"
+    assert folder.ancestors == ["folders/11", "folders/1", "organizations/123"]
+    request = mock_asset_client_cls.return_value.query_assets.call_args.kwargs[
+        "request"
+    ]
+    assert (
+        "name = '//cloudresourcemanager.googleapis.com/folders/11'"
+        in request.statement
+    )
+    mock_folders_cls.return_value.get_folder.assert_not_called()
+
+
+@patch("google.cloud.resourcemanager_v3.FoldersClient")
+@patch("google.cloud.asset_v1.AssetServiceClient")
+def test_load_scope_folder_after_path_lookup(
+    mock_asset_client_cls, mock_folders_cls, mock_org_node
+):
+    """A folder added after a path lookup can still be resolved by path."""
+    mock_org_node.folders["folders/1"] = Folder(
+        name="folders/1",
+        display_name="f1",
+        ancestors=["folders/1", "organizations/123"],
+        organization=mock_org_node,
+        parent="organizations/123",
+    )
+    assert mock_org_node.get_resource_name("/f1") == "folders/1"
+
+    mock_response = MagicMock()
+    mock_response.query_result.rows = [
+        {
+            "f": [
+                {"v": "//cloudresourcemanager.googleapis.com/folders/11"},
+                {"v": "f11"},
+                {"v": "folders/1"},
+                {
+                    "v": [
+                        {"v": "folders/11"},
+                        {"v": "folders/1"},
+                        {"v": "organizations/123"},
+                    ]
+                },
+            ]
+        }
+    ]
+    mock_response.query_result.next_page_token = ""
+    mock_asset_client_cls.return_value.query_assets.return_value = mock_response
+
+    load_scope_folder(mock_org_node, "folders/11")
+
+    assert mock_org_node.get_resource_name("/f1/f11") == "folders/11"
+
+
+@patch("google.cloud.resourcemanager_v3.FoldersClient")
+@patch("google.cloud.asset_v1.AssetServiceClient")
+def test_load_scope_folder_falls_back_to_rm(
+    mock_asset_client_cls, mock_folders_cls, mock_org_node
+):
+    """Test the get_folder() parent walk when the Asset query finds nothing."""
+    mock_response = MagicMock()
+    mock_response.query_result.rows = []
+    mock_response.query_result.next_page_token = ""
+    mock_asset_client_cls.return_value.query_assets.return_value = mock_response
+
+    folders = {
+        "folders/11": resourcemanager_v3.Folder(
+            name="folders/11", display_name="f11", parent="folders/1"
+        ),
+        "folders/1": resourcemanager_v3.Folder(
+            name="folders/1", display_name="f1", parent="organizations/123"
+        ),
+    }
+    mock_folders_cls.return_value.get_folder.side_effect = lambda name: folders[name]
+
+    load_scope_folder(mock_org_node, "folders/11")
+
+    folder = mock_org_node.folders["folders/11"]
+    assert folder.ancestors == ["folders/11", "folders/1", "organizations/123"]
+
+    # A repeated scope load reuses the fetched folders
+    del mock_org_node.folders["folders/11"]
+    load_scope_folder(mock_org_node, "folders/11")
+    assert mock_folders_cls.return_value.get_folder.call_count == 2
+
+
 # Test load_folders_asset
 @patch("google.cloud.asset_v1.AssetServiceClient")
 def test_load_folders_asset(mock_asset_client_cls, mock_org_node):
@@ -101,6 +355,7 @@ def test_load_folders_asset(mock_asset_client_cls, mock_org_node):
     ]
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     load_folders_asset(mock_org_node)
@@ -146,6 +401,7 @@ def test_load_folders_asset_with_mapcomposite(mock_asset_client_cls, mock_org_no
     mock_query_result.rows = [row]
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     load_folders_asset(mock_org_node)
@@ -167,6 +423,7 @@ def test_load_folders_asset_sql_filter(mock_asset_client_cls, mock_org_node):
     mock_query_result.rows = []
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     # Test with parent_filter (scoped query)
@@ -192,6 +449,7 @@ def test_load_folders_asset_sql_no_parent_filter(mock_asset_client_cls, mock_org
     mock_query_result.rows = []
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     # Test without parent_filter (recursive query)
@@ -219,6 +477,7 @@ def test_load_folders_asset_folder_parent_filter(mock_asset_client_cls, mock_org
     mock_query_result.rows = []
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     # Test with folder as parent_filter
@@ -244,6 +503,7 @@ def test_load_folders_asset_ancestors_filter(mock_asset_client_cls, mock_org_nod
     mock_query_result.rows = []
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     # Test with ancestors_filter (recursive under a folder)
@@ -269,8 +529,8 @@ def test_load_folders_asset_ancestors_filter(mock_asset_client_cls, mock_org_nod
 def test_load_projects_asset(mock_asset_client_cls, mock_org_node):
     mock_client = mock_asset_client_cls.return_value
 
-    # Mock row for SELECT name(0), projectNumber(1), projectId(2), parent(3), ancestors(4)
-    def create_project_row(name, p_num, p_id, parent_type, parent_id, ancestors):
+    # Mock row for SELECT name(0), projectId(1), parent(2), ancestors(3)
+    def create_project_row(name, p_id, parent_type, parent_id, ancestors):
         anc_vals = [{"v": anc} for anc in ancestors]
 
         # Use the REAL API format: nested STRUCT with 'f' array
@@ -282,7 +542,6 @@ def test_load_projects_asset(mock_asset_client_cls, mock_org_node):
         row = {
             "f": [
                 {"v": name},
-                {"v": p_num},
                 {"v": p_id},
                 {"v": parent_struct},
                 {"v": anc_vals},
@@ -294,7 +553,6 @@ def test_load_projects_asset(mock_asset_client_cls, mock_org_node):
     mock_query_result.rows = [
         create_project_row(
             "//cloudresourcemanager.googleapis.com/projects/p1",
-            "123",
             "p1-id",
             "folder",
             "f1",
@@ -303,6 +561,7 @@ def test_load_projects_asset(mock_asset_client_cls, mock_org_node):
     ]
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     # Pre-populate a folder to test parent resolution
@@ -334,7 +593,6 @@ def test_load_projects_asset_with_empty_ancestors(mock_asset_client_cls, mock_or
     row = {
         "f": [
             {"v": "//cloudresourcemanager.googleapis.com/projects/789"},
-            {"v": "12345"},  # projectNumber
             {"v": "test-project"},  # projectId
             {
                 "v": {"f": [{"v": "organization"}, {"v": "123"}]}
@@ -347,6 +605,7 @@ def test_load_projects_asset_with_empty_ancestors(mock_asset_client_cls, mock_or
     mock_query_result.rows = [row]
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     projects = load_projects_asset(mock_org_node)
@@ -359,6 +618,134 @@ def test_load_projects_asset_with_empty_ancestors(mock_asset_client_cls, mock_or
     assert p.organization == mock_org_node
 
 
+@patch("google.cloud.asset_v1.AssetServiceClient")
+def test_load_projects_asset_skips_malformed_row(mock_asset_client_cls, mock_org_node):
+    """Test that a malformed row is skipped without dropping the other rows."""
+    mock_client = mock_asset_client_cls.return_value
+
+    bad_row = {
+        "f": [
+            {"v": "//cloudresourcemanager.googleapis.com/projects/1"},
+            {"v": "bad-project"},
+            {"v": {"f": [{"v": 42}, {"v": "123"}]}},  # non-string parent type
+            {"v": []},
+        ]
+    }
+    good_row = {
+        "f": [
+            {"v": "//cloudresourcemanager.googleapis.com/projects/2"},
+            {"v": "good-project"},
+            {"v": {"f": [{"v": "organization"}, {"v": "123"}]}},
+            {"v": []},
+        ]
+    }
+
+    mock_query_result = MagicMock()
+    mock_query_result.rows = [bad_row, good_row]
+    mock_response = MagicMock()
+    mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
+    mock_client.query_assets.return_value = mock_response
+
+    projects = load_projects_asset(mock_org_node)
+
+    assert [p.project_id for p in projects] == ["good-project"]
+
+
+@patch("google.cloud.asset_v1.AssetServiceClient")
+def test_fetch_then_load_projects_asset(mock_asset_client_cls, mock_org_node):
+    """Test that prefetched rows are parsed without querying again."""
+    mock_client = mock_asset_client_cls.return_value
+    row = {
+        "f": [
+            {"v": "//cloudresourcemanager.googleapis.com/projects/1"},
+            {"v": "prefetched"},
+            {"v": {"f": [{"v": "organization"}, {"v": "123"}]}},
+            {"v": []},
+        ]
+    }
+    mock_response = MagicMock()
+    mock_response.query_result.rows = [row]
+    mock_response.query_result.next_page_token = ""
+    mock_client.query_assets.return_value = mock_response
+
+    rows = fetch_project_rows_asset(mock_org_node)
+    projects = load_projects_asset(mock_org_node, rows=rows)
+
+    assert [p.project_id for p in projects] == ["prefetched"]
+    assert mock_client.query_assets.call_count == 1
+
+
+@patch("google.cloud.asset_v1.AssetServiceClient")
+def test_load_projects_asset_follows_job_and_pages(
+    mock_asset_client_cls, mock_org_node, fake_clock
+):
+    """Test that pending jobs are polled and every result page is consumed."""
+    mock_client = mock_asset_client_cls.return_value
+
+    def create_row(number):
+        return {
+            "f": [
+                {"v": f"//cloudresourcemanager.googleapis.com/projects/{number}"},
+                {"v": f"project-{number}"},
+                {"v": {"f": [{"v": "organization"}, {"v": "123"}]}},
+                {"v": []},
+            ]
+        }
+
+    pending = MagicMock(done=False, job_reference="job-1")
+    first_page = MagicMock(done=True, job_reference="job-1")
+    first_page.query_result.rows = [create_row(1)]
+    first_page.query_result.next_page_token = "page-2"
+    last_page = MagicMock(done=True, job_reference="job-1")
+    last_page.query_result.rows = [create_row(2)]
+    last_page.query_result.next_page_token = ""
+    mock_client.query_assets.side_effect = [pending, first_page, last_page]
+
+    projects = load_projects_asset(mock_org_node)
+
+    assert [p.project_id for p in projects] == ["project-1", "project-2"]
+    requests = [c.kwargs["request"] for c in mock_client.query_assets.call_args_list]
+    assert requests[1].job_reference == "job-1"
+    assert requests[1].page_token == ""
+    assert requests[2].job_reference == "job-1"
+    assert requests[2].page_token == "page-2"
+    assert all(r.page_size == ASSET_QUERY_PAGE_SIZE for r in requests)
+    assert all(r.timeout == ASSET_QUERY_TIMEOUT for r in requests)
+    # Only the pending response waits before the next call
+    fake_clock.sleep.assert_called_once_with(1.0)
+
+
+def _query_request():
+    return asset_v1.QueryAssetsRequest(parent="organizations/123", statement="SELECT 1")
+
+
+def test_iter_query_rows_gives_up_on_unfinished_job(fake_clock):
+    """Test that an unfinished job is polled with capped backoff, then abandoned."""
+    client = MagicMock()
+    client.query_assets.return_value = MagicMock(done=False, job_reference="job-1")
+
+    with pytest.raises(exceptions.DeadlineExceeded):
+        list(_iter_query_rows(client, _query_request(), "folder"))
+
+    delays = [c.args[0] for c in fake_clock.sleep.call_args_list]
+    assert delays[:5] == [1.0, 2.0, 4.0, 8.0, ASSET_QUERY_POLL_MAX_DELAY]
+    assert max(delays) == ASSET_QUERY_POLL_MAX_DELAY
+    assert sum(delays) == ASSET_QUERY_MAX_WAIT_SECONDS
+
+
+def test_iter_query_rows_rejects_unfinished_job_without_reference(fake_clock):
+    """Test that an unfinished job without a reference fails instead of looping."""
+    client = MagicMock()
+    client.query_assets.return_value = MagicMock(done=False, job_reference="")
+
+    with pytest.raises(exceptions.InternalServerError):
+        list(_iter_query_rows(client, _query_request(), "folder"))
+
+    assert client.query_assets.call_count == 1
+    fake_clock.sleep.assert_not_called()
+
+
 @patch("google.cloud.asset_v1.AssetServiceClient")
 def test_load_projects_asset_sql_filter(mock_asset_client_cls, mock_org_node):
     """Test that project SQL query includes lifecycleState and parent.id filters when parent_filter is provided."""
@@ -368,6 +755,7 @@ def test_load_projects_asset_sql_filter(mock_asset_client_cls, mock_org_node):
     mock_query_result.rows = []
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     # Test with parent_filter (scoped query)
@@ -393,6 +781,7 @@ def test_load_projects_asset_sql_no_parent_filter(mock_asset_client_cls, mock_or
     mock_query_result.rows = []
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     # Test without parent_filter (unscoped query)
@@ -418,6 +807,7 @@ def test_load_projects_asset_ancestors_filter(mock_asset_client_cls, mock_org_no
     mock_query_result.rows = []
     mock_response = MagicMock()
     mock_response.query_result = mock_query_result
+    mock_query_result.next_page_token = ""
     mock_client.query_assets.return_value = mock_response
 
     # Test with ancestors_filter (recursive under a folder)
@@ -466,3 +856,26 @@ def test_load_organizationless_projects(mock_proj_cls):
     assert projects[0].display_name == "P Orgless"
     assert projects[0].organization is None
     assert projects[0].folder is None
+    request = mock_proj_client.search_projects.call_args.kwargs["request"]
+    assert request.query == "-parent:organizations/* -parent:folders/*"
+
+
+@patch("google.cloud.resourcemanager_v3.ProjectsClient")
+def test_load_organizationless_projects_filter_rejected(mock_proj_cls):
+    """Test falling back to an unfiltered search if the query is rejected."""
+    mock_proj_client = mock_proj_cls.return_value
+    p_proto = MagicMock()
+    p_proto.name = "projects/p-orgless"
+    p_proto.parent = ""
+    p_proto.project_id = "p-orgless"
+    p_proto.display_name = ""
+    mock_proj_client.search_projects.side_effect = [
+        exceptions.InvalidArgument("bad query"),
+        [p_proto],
+    ]
+
+    projects = load_organizationless_projects(set())
+
+    assert [p.project_id for p in projects] == ["p-orgless"]
+    request = mock_proj_client.search_projects.call_args.kwargs["request"]
+    assert request.query == ""
@@ -90,6 +90,15 @@ def test_parse_parent_struct_organization():
     assert result == "organizations/789"
 
 
+def test_parse_parent_struct_unknown_type():
+    """Test parsing parent STRUCT with a type outside the known set."""
+    parent_col = {"v": {"f": [{"v": "widget"}, {"v": "1"}]}}
+    assert parse_parent_struct(parent_col) == "widgets/1"
+
+    parent_col = {"v": {"f": [{"v": "widgets"}, {"v": "1"}]}}
+    assert parse_parent_struct(parent_col) == "widgets/1"
+
+
 def test_parse_parent_struct_empty():
     """Test parsing empty parent STRUCT."""
     assert parse_parent_struct({"v": None}) is None
@@ -157,7 +166,6 @@ def test_parse_project_row():
     row = {
         "f": [
             {"v": "//cloudresourcemanager.googleapis.com/projects/789"},
-            {"v": "12345"},  # projectNumber
             {"v": "test-project"},  # projectId
             {"v": {"f": [{"v": "folder"}, {"v": "456"}]}},  # parent STRUCT
             {"v": [{"v": "folders/456"}, {"v": "organizations/123"}]},  # ancestors
@@ -177,7 +185,6 @@ def test_parse_project_row_with_empty_ancestors():
     row = {
         "f": [
             {"v": "//cloudresourcemanager.googleapis.com/projects/789"},
-            {"v": "12345"},
             {"v": "test-project"},
             {"v": {"f": [{"v": "organization"}, {"v": "123"}]}},
             {"v": []},  # Empty ancestors
@@ -326,3 +333,22 @@ def test_build_folder_ancestors_org_parent():
         name, raw_ancestors, parent, loaded_folders, org_name
     )
     assert result == ["folders/1", "organizations/123"]
+
+
+def test_build_folder_ancestors_reuses_loaded_parent_chain():
+    """Test that a loaded parent's full chain is spliced in after the parent."""
+    name = "folders/3"
+    parent = "folders/2"
+
+    class MockFolder:
+        def __init__(self, ancestors):
+            self.ancestors = ancestors
+
+    loaded_folders = {
+        "folders/2": MockFolder(["folders/2", "folders/1", "organizations/123"])
+    }
+
+    result = build_folder_ancestors(
+        name, [], parent, loaded_folders, "organizations/123"
+    )
+    assert result == ["folders/3", "folders/2", "folders/1", "organizations/123"]